@@ -0,0 +1,74 @@
+"""Micro-benchmark: suggestion edit distance against the previous row-by-row DP
+
+Run from the python/ directory:
+
+    python benchmarks/bench_edit_distance.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from notepad_app import SpellChecker, edit_distance
+
+
+def levenshtein_distance(s1, s2):
+    """The full O(m*n) dynamic program previously used for scoring"""
+    if len(s1) < len(s2):
+        return levenshtein_distance(s2, s1)
+
+    if len(s2) == 0:
+        return len(s1)
+
+    previous_row = range(len(s2) + 1)
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def make_typo(word, rng):
+    """Apply one random insertion, deletion, substitution or transposition"""
+    i = rng.randrange(len(word))
+    letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    kind = rng.randrange(4)
+    if kind == 0:
+        return word[:i] + letter + word[i:]
+    if kind == 1 and len(word) > 1:
+        return word[:i] + word[i + 1:]
+    if kind == 2 and i + 1 < len(word):
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + letter + word[i + 1:]
+
+
+def main():
+    rng = random.Random(42)
+    words = sorted(SpellChecker().load_builtin_words())
+    # Typical scoring workload: a typo against candidates of similar length
+    pairs = [(make_typo(rng.choice(words), rng), rng.choice(words)) for _ in range(5000)]
+
+    cases = [
+        ("row-by-row DP (previous)", lambda: [levenshtein_distance(a, b) for a, b in pairs]),
+        ("bit-parallel", lambda: [edit_distance(a, b) for a, b in pairs]),
+        ("bit-parallel, bound 2", lambda: [edit_distance(a, b, 2) for a, b in pairs]),
+    ]
+
+    print(f"{len(pairs)} word pairs, best of 5 runs")
+    baseline = None
+    for name, run in cases:
+        best = min(timeit.repeat(run, number=1, repeat=5))
+        baseline = baseline or best
+        print(f"  {name:<26} {best * 1000:8.1f} ms  {baseline / best:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
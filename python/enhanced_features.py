@@ -4,65 +4,365 @@ This module provides additional advanced features for the notepad application.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, colorchooser
+from tkinter import ttk, messagebox, filedialog, colorchooser, font as tkfont
 import json
 import re
 import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Tuple, Any
-import webbrowser
-import subprocess
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional, Tuple, Any, Iterable, Union
+from collections import Counter, OrderedDict
+import functools
+import hashlib
 import sys
 
+VOWEL_RUNS = re.compile(r'[aeiouy]+')
+
+@functools.lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Approximate syllables in a lowercase word: vowel groups, minus a silent final e"""
+    syllable_count = max(1, len(VOWEL_RUNS.findall(word)))
+    if word.endswith('e'):
+        syllable_count -= 1
+    return max(1, syllable_count)
+
+@dataclass
+class TextStats:
+    """Counts gathered by one TextTokenizer pass"""
+    word_count: int = 0
+    character_count: int = 0
+    non_space_count: int = 0
+    sentence_count: int = 0
+    sentence_token_count: int = 0  # whitespace-separated tokens inside sentences
+    paragraph_count: int = 0
+    syllable_count: int = 0
+    word_frequency: Counter = field(default_factory=Counter)
+    # Sentence continuity at the edges, so stats of adjacent segments merge exactly
+    opens_with_sentence: bool = False
+    ends_in_sentence: bool = False
+    
+    def merge(self, other: 'TextStats') -> 'TextStats':
+        """Add the stats of the text that directly follows this one"""
+        self.word_count += other.word_count
+        self.character_count += other.character_count
+        self.non_space_count += other.non_space_count
+        self.sentence_count += other.sentence_count
+        self.sentence_token_count += other.sentence_token_count
+        self.syllable_count += other.syllable_count
+        self.word_frequency.update(other.word_frequency)
+        if self.ends_in_sentence and other.opens_with_sentence:
+            self.sentence_count -= 1  # one sentence running across the seam
+        if other.paragraph_count:
+            if not self.paragraph_count:
+                self.opens_with_sentence = other.opens_with_sentence
+            self.ends_in_sentence = other.ends_in_sentence
+        self.paragraph_count += other.paragraph_count
+        return self
+    
+    @property
+    def reading_time(self) -> float:
+        """Minutes at an average 200 words per minute"""
+        return self.word_count / 200
+    
+    @property
+    def flesch_reading_ease(self) -> Optional[float]:
+        if not self.sentence_count or not self.word_count:
+            return None
+        return (206.835 - (1.015 * (self.word_count / self.sentence_count))
+                - (84.6 * (self.syllable_count / self.word_count)))
+
+class TextTokenizer:
+    """Single-pass tokenizer producing words, sentences, paragraphs and syllables
+    
+    One regex sweep classifies each token as a word, a run of sentence
+    terminators, a newline or other punctuation; sentence and paragraph
+    boundaries follow from token positions, so nothing is re-scanned. Text
+    can be fed in chunks (e.g. lines of a file); only the unfinished token
+    at the end of a chunk is carried over.
+    """
+    
+    TOKEN_PATTERN = re.compile(r'(\w+)|([.!?]+)|(\n)|([^\w\s.!?]+)')
+    WORD, TERMINATOR, NEWLINE, OTHER = 1, 2, 3, 4
+    
+    def __init__(self):
+        self.stats = TextStats()
+        self._offset = 0  # absolute position of the next character fed
+        self._carry = ''
+        self._token_end = -1  # end of the last word or punctuation token
+        self._newline_end = -1
+        self._newline_run = 0
+        self._in_sentence = False
+        self._in_paragraph = False
+    
+    @classmethod
+    def analyze(cls, source: Union[str, Iterable[str]]) -> TextStats:
+        """Statistics for a string or an iterable of text chunks"""
+        tokenizer = cls()
+        if isinstance(source, str):
+            tokenizer._process(source)
+        else:
+            for chunk in source:
+                tokenizer.feed(chunk)
+        return tokenizer.close()
+    
+    def feed(self, chunk: str):
+        text = self._carry + chunk
+        # Tokens never contain whitespace, so everything up to the last
+        # whitespace character can be processed now
+        cut = max(text.rfind(' '), text.rfind('\n'), text.rfind('\t')) + 1
+        self._carry = text[cut:]
+        if cut:
+            self._process(text[:cut])
+    
+    def close(self) -> TextStats:
+        if self._carry:
+            self._process(self._carry)
+            self._carry = ''
+        return self.stats
+    
+    def _process(self, text: str):
+        stats = self.stats
+        base = self._offset
+        self._offset += len(text)
+        stats.character_count += len(text)
+        stats.non_space_count += len(text) - text.count(' ')
+        
+        frequency = stats.word_frequency
+        for match in self.TOKEN_PATTERN.finditer(text):
+            kind = match.lastindex
+            start = base + match.start()
+            
+            if kind == self.NEWLINE:
+                # Paragraphs are separated by non-overlapping pairs of newlines
+                if start == self._newline_end and self._newline_run == 1:
+                    self._newline_run = 0
+                    self._in_paragraph = False
+                else:
+                    self._newline_run = 1
+                self._newline_end = start + 1
+                continue
+            
+            if not self._in_paragraph:
+                if not stats.paragraph_count:
+                    stats.opens_with_sentence = kind != self.TERMINATOR
+                stats.paragraph_count += 1
+                self._in_paragraph = True
+            
+            if kind == self.TERMINATOR:
+                self._in_sentence = stats.ends_in_sentence = False
+                self._token_end = -1
+                continue
+            
+            if not self._in_sentence:
+                stats.sentence_count += 1
+                self._in_sentence = stats.ends_in_sentence = True
+            if start != self._token_end:
+                stats.sentence_token_count += 1
+            self._token_end = base + match.end()
+            
+            if kind == self.WORD:
+                word = match.group().lower()
+                frequency[word] += 1
+                stats.word_count += 1
+                stats.syllable_count += count_syllables(word)
+
+GRAMMAR_RULES_FILE = Path.home() / ".notepad_app" / "grammar_rules.json"
+
+class GrammarRuleEngine:
+    """Grammar rules applied in a single scan of the text
+    
+    Words, sentence terminators and runs of spaces come from one tokenizing
+    regex; literal mistakes are a dictionary lookup on each word, while
+    capitalization and repeated words follow from the previous token.
+    User rules are read from a JSON file of the form
+    
+        {"mistakes": {"wrong": "right", ...},
+         "patterns": [{"pattern": "...", "message": "...", "suggestion": "..."}]}
+    
+    Literal mistakes join the built-in lookup table; regex patterns are
+    compiled together into one alternation with a named group per rule.
+    """
+    
+    COMMON_MISTAKES = {
+        'teh': 'the',
+        'adn': 'and',
+        'yuo': 'you',
+        'taht': 'that',
+        'form': 'from',
+        'thier': 'their',
+        'recieve': 'receive',
+        'seperate': 'separate',
+        'definately': 'definitely',
+        'neccessary': 'necessary'
+    }
+    TOKEN_PATTERN = re.compile(r'(\w+)|([.!?]+)|( {2,})|(\S)')
+    WORD, TERMINATOR, SPACES, OTHER = 1, 2, 3, 4
+    
+    def __init__(self, mistakes: Optional[Dict[str, str]] = None,
+                 patterns: Optional[List[Dict[str, str]]] = None):
+        self.mistakes = dict(self.COMMON_MISTAKES)
+        for wrong, right in (mistakes or {}).items():
+            self.mistakes[wrong.lower()] = right
+        
+        self.patterns = []  # rules joined into pattern_regex
+        self.separate_patterns = []  # (compiled regex, rule) for rules that cannot be joined
+        branches = []
+        for rule in patterns or []:
+            try:
+                compiled = re.compile(rule['pattern'], re.IGNORECASE)
+            except (KeyError, TypeError, re.error) as e:
+                print(f"Skipping grammar rule {rule!r}: {e}")
+                continue
+            branch = f"(?P<rule{len(self.patterns)}>{rule['pattern']})"
+            # Groups (and so backreferences) would be renumbered inside the
+            # alternation, and inline flags must start the whole pattern
+            if compiled.groups or not self._joinable(branch):
+                self.separate_patterns.append((compiled, rule))
+                continue
+            branches.append(branch)
+            self.patterns.append(rule)
+        
+        self.pattern_regex = None
+        if branches:
+            try:
+                self.pattern_regex = re.compile('|'.join(branches), re.IGNORECASE)
+            except re.error:
+                self.separate_patterns.extend((re.compile(rule['pattern'], re.IGNORECASE), rule)
+                                              for rule in self.patterns)
+                self.patterns = []
+    
+    @staticmethod
+    def _joinable(branch: str) -> bool:
+        """Whether a branch still compiles when it is not the start of the pattern"""
+        try:
+            re.compile('(?:)|' + branch)
+            return True
+        except re.error:
+            return False
+    
+    @classmethod
+    def load(cls, path: Path) -> 'GrammarRuleEngine':
+        """Engine with the user rules in path, or only the built-in ones"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return cls(data.get('mistakes'), data.get('patterns'))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, AttributeError, re.error) as e:
+            print(f"Error loading grammar rules: {e}")
+            return cls()
+    
+    def check(self, text: str) -> List[Dict[str, Any]]:
+        issues = []
+        mistakes = self.mistakes
+        sentence_start = True
+        previous_word = None  # (lowercase word, start, end) of the last word token
+        
+        for match in self.TOKEN_PATTERN.finditer(text):
+            kind = match.lastindex
+            start = match.start()
+            
+            if kind == self.SPACES:
+                issues.append({
+                    'type': 'spacing',
+                    'message': 'Multiple consecutive spaces found',
+                    'position': start,
+                    'suggestion': 'Use single space'
+                })
+                continue
+            
+            if kind == self.TERMINATOR:
+                sentence_start = True
+                previous_word = None
+                continue
+            
+            if kind == self.OTHER:
+                sentence_start = False
+                previous_word = None
+                continue
+            
+            word = match.group()
+            lower = word.lower()
+            if sentence_start and word[0].islower():
+                issues.append({
+                    'type': 'capitalization',
+                    'message': 'Sentence should start with capital letter',
+                    'position': start,
+                    'suggestion': f'Capitalize "{word[0]}"'
+                })
+            sentence_start = False
+            
+            if (previous_word and previous_word[0] == lower
+                    and text[previous_word[2]:start].isspace()):
+                issues.append({
+                    'type': 'repetition',
+                    'message': f'Repeated word: "{text[previous_word[1]:previous_word[2]]}"',
+                    'position': previous_word[1],
+                    'suggestion': 'Remove duplicate word'
+                })
+            previous_word = (lower, start, match.end())
+            
+            correction = mistakes.get(lower)
+            if correction:
+                issues.append({
+                    'type': 'common_mistake',
+                    'message': f'Possible misspelling: "{word}"',
+                    'position': start,
+                    'suggestion': f'Did you mean "{correction}"?'
+                })
+        
+        matches = []
+        if self.pattern_regex:
+            matches.extend((match, self.patterns[int(match.lastgroup[4:])])
+                           for match in self.pattern_regex.finditer(text))
+        for regex, rule in self.separate_patterns:
+            matches.extend((match, rule) for match in regex.finditer(text))
+        if matches:
+            for match, rule in matches:
+                issues.append({
+                    'type': rule.get('type', 'custom'),
+                    'message': rule.get('message', f'Matched rule: "{match.group()}"'),
+                    'position': match.start(),
+                    'suggestion': rule.get('suggestion', '')
+                })
+            issues.sort(key=lambda issue: issue['position'])
+        
+        return issues
+
+# Words too common to say anything about a note, left out of word clouds
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each even few for from further
+had has have having he her here hers herself him himself his how i if in into is it its itself
+just like make many me more most much must my myself no nor not now of off on once only or other
+our ours ourselves out over own same she should so some such than that the their theirs them
+themselves then there these they this those through to too under until up us very was we were
+what when where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
 # Advanced spell checking and text analysis
 class AdvancedTextAnalyzer:
-    """Advanced text analysis and spell checking features"""
+    """Advanced text analysis and spell checking features
+    
+    Text is analyzed paragraph by paragraph and each result is memoized by
+    content hash, so re-analyzing a long note after an edit only tokenizes
+    and grammar-checks the paragraphs that changed.
+    """
+    
+    PARAGRAPH_CACHE_SIZE = 4096
+    PARAGRAPH_CHUNK_CHARS = 2000  # longer paragraphs are analyzed in steps of about this size
+    SENTENCE_ENDS = ('. ', '! ', '? ', '.\n', '!\n', '?\n')
     
     def __init__(self):
-        self.word_frequency = {}
-        self.reading_level_cache = {}
+        self.paragraph_cache = OrderedDict()  # content hash -> (TextStats, grammar issues)
         self.grammar_rules = self.load_grammar_rules()
     
     def load_grammar_rules(self):
-        """Load basic grammar checking rules"""
-        return {
-            'double_spaces': r'  +',
-            'sentence_spacing': r'[.!?]\s*[a-z]',
-            'capitalization': r'^\s*[a-z]',
-            'repeated_words': r'\b(\w+)\s+\1\b',
-            'common_mistakes': {
-                r'\bteh\b': 'the',
-                r'\badn\b': 'and',
-                r'\byuo\b': 'you',
-                r'\btaht\b': 'that',
-                r'\bwith\b': 'with',
-                r'\bform\b': 'from',
-                r'\bthier\b': 'their',
-                r'\brecieve\b': 'receive',
-                r'\boccur\b': 'occur',
-                r'\bseperate\b': 'separate',
-                r'\bdefinately\b': 'definitely',
-                r'\bneccessary\b': 'necessary',
-                r'\baccommodate\b': 'accommodate',
-                r'\bbeginning\b': 'beginning',
-                r'\bcommittee\b': 'committee',
-                r'\bembarrass\b': 'embarrass',
-                r'\bexistence\b': 'existence',
-                r'\bgovernment\b': 'government',
-                r'\bindependent\b': 'independent',
-                r'\bmaintenance\b': 'maintenance',
-                r'\boccasionally\b': 'occasionally',
-                r'\bpersistence\b': 'persistence',
-                r'\bprivilege\b': 'privilege',
-                r'\brecommend\b': 'recommend',
-                r'\bsimilar\b': 'similar',
-                r'\btomorrow\b': 'tomorrow',
-                r'\bunfortunately\b': 'unfortunately'
-            }
-        }
+        """Built-in grammar rules plus any user rules from GRAMMAR_RULES_FILE"""
+        return GrammarRuleEngine.load(GRAMMAR_RULES_FILE)
     
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """Comprehensive text analysis"""
@@ -79,126 +379,128 @@ class AdvancedTextAnalyzer:
                 'spelling_errors': 0
             }
         
-        # Basic counts
-        words = re.findall(r'\b\w+\b', text.lower())
-        sentences = re.split(r'[.!?]+', text)
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-        
-        # Word frequency analysis
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        
-        most_common = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
-        
-        # Reading time (average 200 words per minute)
-        reading_time = len(words) / 200
-        
-        # Grammar issues
-        grammar_issues = self.check_grammar(text)
-        
+        stats, issues = self.analyze_paragraphs(text)
+        return dict(self.statistics_summary(stats), grammar_issues=issues)
+    
+    def analyze_paragraphs(self, text: str) -> Tuple[TextStats, List[Dict[str, Any]]]:
+        """Whole-document stats and grammar issues merged from cached paragraphs"""
+        stats = TextStats()
+        issues = []
+        offset = 0
+        for paragraph in self.split_paragraphs(text):
+            paragraph_stats, paragraph_issues = self.analyze_paragraph(paragraph)
+            stats.merge(paragraph_stats)
+            for issue in paragraph_issues:
+                issues.append(dict(issue, position=issue['position'] + offset))
+            offset += len(paragraph)
+        return stats, issues
+    
+    def split_paragraphs(self, text: str) -> List[str]:
+        """Paragraphs with their trailing blank-line separator, joining back to text"""
+        paragraphs = text.split('\n\n')
+        for i in range(len(paragraphs) - 1):
+            paragraphs[i] += '\n\n'
+        return paragraphs
+    
+    def analyze_paragraph(self, paragraph: str) -> Tuple[TextStats, List[Dict[str, Any]]]:
+        """Stats and grammar issues for one paragraph, from the LRU cache when possible"""
+        steps = self.analyze_paragraph_steps(paragraph)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+    
+    def analyze_paragraph_steps(self, paragraph: str):
+        """Generator form of analyze_paragraph, for time-sliced callers
+        
+        Yields after each chunk of about PARAGRAPH_CHUNK_CHARS of a long
+        paragraph and returns (TextStats, grammar issues). Chunks only end
+        after a sentence terminator, where the grammar check starts afresh
+        anyway, so a chunk grows until it reaches one. The results match a
+        single pass unless a custom pattern spans the cut.
+        """
+        key = hashlib.blake2b(paragraph.encode('utf-8'), digest_size=16).digest()
+        cached = self.paragraph_cache.get(key)
+        if cached is not None:
+            self.paragraph_cache.move_to_end(key)
+            return cached
+        
+        if len(paragraph) <= self.PARAGRAPH_CHUNK_CHARS:
+            result = (TextTokenizer.analyze(paragraph), self.grammar_rules.check(paragraph))
+        else:
+            tokenizer = TextTokenizer()
+            issues = []
+            offset = 0
+            while offset < len(paragraph):
+                end = offset + self.PARAGRAPH_CHUNK_CHARS
+                if end < len(paragraph):
+                    cut = max(paragraph.rfind(marker, offset, end) for marker in self.SENTENCE_ENDS)
+                    if cut <= offset:
+                        cut = min((index for index in (paragraph.find(marker, end - 1)
+                                                       for marker in self.SENTENCE_ENDS) if index >= 0),
+                                  default=len(paragraph))
+                    end = cut + 1
+                chunk = paragraph[offset:end]
+                tokenizer.feed(chunk)
+                for issue in self.grammar_rules.check(chunk):
+                    issues.append(dict(issue, position=issue['position'] + offset))
+                offset += len(chunk)
+                yield
+            result = (tokenizer.close(), issues)
+        
+        self.paragraph_cache[key] = result
+        if len(self.paragraph_cache) > self.PARAGRAPH_CACHE_SIZE:
+            self.paragraph_cache.popitem(last=False)
+        return result
+    
+    def analyze_stream(self, chunks: Iterable[str]) -> Dict[str, Any]:
+        """Counts and reading level for text read in chunks, e.g. an open file"""
+        return self.statistics_summary(TextTokenizer.analyze(chunks))
+    
+    def statistics_summary(self, stats: TextStats) -> Dict[str, Any]:
+        """The analyze_text metrics that come from a TextStats"""
         return {
-            'word_count': len(words),
-            'character_count': len(text),
-            'character_count_no_spaces': len(text.replace(' ', '')),
-            'sentence_count': len([s for s in sentences if s.strip()]),
-            'paragraph_count': len(paragraphs),
-            'reading_time': reading_time,
-            'reading_level': self.calculate_reading_level(text),
-            'most_common_words': most_common,
-            'grammar_issues': grammar_issues,
-            'average_words_per_sentence': len(words) / max(len([s for s in sentences if s.strip()]), 1),
-            'average_sentence_length': sum(len(s.split()) for s in sentences if s.strip()) / max(len([s for s in sentences if s.strip()]), 1)
+            'word_count': stats.word_count,
+            'character_count': stats.character_count,
+            'character_count_no_spaces': stats.non_space_count,
+            'sentence_count': stats.sentence_count,
+            'paragraph_count': stats.paragraph_count,
+            'reading_time': stats.reading_time,
+            'reading_level': self.reading_level_label(stats.flesch_reading_ease),
+            'most_common_words': stats.word_frequency.most_common(10),
+            'average_words_per_sentence': stats.word_count / max(stats.sentence_count, 1),
+            'average_sentence_length': stats.sentence_token_count / max(stats.sentence_count, 1)
         }
     
     def check_grammar(self, text: str) -> List[Dict[str, Any]]:
         """Basic grammar checking"""
-        issues = []
-        
-        # Check for double spaces
-        for match in re.finditer(self.grammar_rules['double_spaces'], text):
-            issues.append({
-                'type': 'spacing',
-                'message': 'Multiple consecutive spaces found',
-                'position': match.start(),
-                'suggestion': 'Use single space'
-            })
-        
-        # Check for sentence capitalization
-        sentences = re.split(r'[.!?]+', text)
-        pos = 0
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and sentence[0].islower():
-                issues.append({
-                    'type': 'capitalization',
-                    'message': 'Sentence should start with capital letter',
-                    'position': pos,
-                    'suggestion': f'Capitalize "{sentence[0]}"'
-                })
-            pos += len(sentence) + 1
-        
-        # Check for repeated words
-        for match in re.finditer(self.grammar_rules['repeated_words'], text, re.IGNORECASE):
-            issues.append({
-                'type': 'repetition',
-                'message': f'Repeated word: "{match.group(1)}"',
-                'position': match.start(),
-                'suggestion': 'Remove duplicate word'
-            })
-        
-        # Check common mistakes
-        for pattern, correction in self.grammar_rules['common_mistakes'].items():
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                issues.append({
-                    'type': 'common_mistake',
-                    'message': f'Possible misspelling: "{match.group()}"',
-                    'position': match.start(),
-                    'suggestion': f'Did you mean "{correction}"?'
-                })
-        
-        return issues
+        return self.analyze_paragraphs(text)[1]
     
     def calculate_reading_level(self, text: str) -> str:
         """Calculate approximate reading level using Flesch Reading Ease"""
         if not text.strip():
             return 'N/A'
-        
-        # Count sentences, words, and syllables
-        sentences = len(re.split(r'[.!?]+', text))
-        words = len(re.findall(r'\b\w+\b', text))
-        
-        if sentences == 0 or words == 0:
+        return self.reading_level_label(self.analyze_paragraphs(text)[0].flesch_reading_ease)
+    
+    def reading_level_label(self, score: Optional[float]) -> str:
+        """Grade band for a Flesch Reading Ease score"""
+        if score is None:
             return 'N/A'
-        
-        # Approximate syllable count
-        syllables = 0
-        for word in re.findall(r'\b\w+\b', text.lower()):
-            syllable_count = max(1, len(re.findall(r'[aeiouy]+', word)))
-            if word.endswith('e'):
-                syllable_count -= 1
-            syllables += max(1, syllable_count)
-        
-        # Flesch Reading Ease formula
-        if sentences > 0 and words > 0:
-            score = 206.835 - (1.015 * (words / sentences)) - (84.6 * (syllables / words))
-            
-            if score >= 90:
-                return 'Very Easy (5th grade)'
-            elif score >= 80:
-                return 'Easy (6th grade)'
-            elif score >= 70:
-                return 'Fairly Easy (7th grade)'
-            elif score >= 60:
-                return 'Standard (8th-9th grade)'
-            elif score >= 50:
-                return 'Fairly Difficult (10th-12th grade)'
-            elif score >= 30:
-                return 'Difficult (College level)'
-            else:
-                return 'Very Difficult (Graduate level)'
-        
-        return 'N/A'
+        if score >= 90:
+            return 'Very Easy (5th grade)'
+        elif score >= 80:
+            return 'Easy (6th grade)'
+        elif score >= 70:
+            return 'Fairly Easy (7th grade)'
+        elif score >= 60:
+            return 'Standard (8th-9th grade)'
+        elif score >= 50:
+            return 'Fairly Difficult (10th-12th grade)'
+        elif score >= 30:
+            return 'Difficult (College level)'
+        else:
+            return 'Very Difficult (Graduate level)'
 
 class PluginManager:
     """Plugin system for extending functionality"""
@@ -208,6 +510,8 @@ class PluginManager:
         self.plugins = {}
         self.plugin_dir = Path.home() / ".notepad_app" / "plugins"
         self.plugin_dir.mkdir(exist_ok=True)
+        self.text_analyzer = app_instance.text_analyzer
+        self._word_cloud_fonts = []
         self.load_plugins()
     
     def load_plugins(self):
@@ -241,46 +545,102 @@ class PluginManager:
             }
         }
     
+    WORD_CLOUD_SIZE = 50
+    WORD_CLOUD_FONT_SIZES = (8, 10, 12, 14, 16, 18, 20, 22, 24)
+    WORD_CLOUD_POLL_MS = 100
+    
+    def word_cloud_fonts(self):
+        """One Font per cloud size, created on first use and shared by every render"""
+        if not self._word_cloud_fonts:
+            self._word_cloud_fonts = [tkfont.Font(root=self.app.root, family='Arial', size=size)
+                                      for size in self.WORD_CLOUD_FONT_SIZES]
+        return self._word_cloud_fonts
+    
     def generate_word_cloud(self):
-        """Generate word cloud from current note"""
-        if self.app.current_note_index is None:
-            messagebox.showwarning("No Note", "Please select a note to generate word cloud.")
-            return
-        
-        note = self.app.notes[self.app.current_note_index]
-        
-        # Simple word frequency analysis
-        words = re.findall(r'\b\w+\b', note.content.lower())
-        word_freq = {}
-        for word in words:
-            if len(word) > 3:  # Skip short words
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        if not word_freq:
-            messagebox.showinfo("Word Cloud", "Not enough words to generate word cloud.")
-            return
+        """Word cloud for the current note, a category or all notes
+        
+        Only the open note is counted up front. Category and all-notes clouds
+        wait for the background term frequency sync to drain.
+        """
+        store = self.app.term_frequencies
+        self.app.flush_large_document_sync()
+        
+        current_note = None
+        if self.app.current_note_index is not None:
+            current_note = self.app.notes[self.app.current_note_index]
+            store.sync_note(current_note)
+        # Restarting the sync is cheap: notes that have not changed are skipped
+        self.app.schedule_term_frequency_sync(0)
+        categories = {category.name for category in self.app.categories} | set(store.category_terms)
+        scopes = ["All notes"] + [f"Category: {category}" for category in sorted(categories)]
+        if current_note is not None:
+            scopes.insert(0, f"Note: {current_note.title}")
         
-        # Show top words in a dialog
         dialog = tk.Toplevel(self.app.root)
-        dialog.title(f"Word Cloud - {note.title}")
-        dialog.geometry("400x500")
+        dialog.title("Word Cloud")
+        dialog.geometry("400x540")
         dialog.transient(self.app.root)
         
         ttk.Label(dialog, text="Most Frequent Words", font=('Arial', 14, 'bold')).pack(pady=10)
+        scope_var = tk.StringVar(value=scopes[0])
+        scope_combo = ttk.Combobox(dialog, textvariable=scope_var, values=scopes, state="readonly")
+        scope_combo.pack(fill=tk.X, padx=20)
         
         # Create text widget to display words
         text_widget = tk.Text(dialog, wrap=tk.WORD, font=('Arial', 12))
         text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        # Sort words by frequency
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        
-        for word, count in sorted_words[:50]:  # Top 50 words
-            size = min(24, 8 + (count * 2))  # Scale font size by frequency
-            text_widget.insert(tk.END, f"{word} ", f"size_{size}")
-            text_widget.tag_configure(f"size_{size}", font=('Arial', size))
-        
-        text_widget.configure(state='disabled')
+        # Tags are configured once per dialog; re-rendering only replaces the text
+        tags = []
+        for size, font in zip(self.WORD_CLOUD_FONT_SIZES, self.word_cloud_fonts()):
+            text_widget.tag_configure(f"size_{size}", font=font)
+            tags.append(f"size_{size}")
+        
+        pending = {}  # 'after' -> id of the poll waiting for the sync
+        
+        def render(event=None):
+            if pending:
+                dialog.after_cancel(pending.pop('after'))
+            scope = scope_var.get()
+            if not scope.startswith("Note: ") and self.app.scheduler.is_scheduled('term_frequencies'):
+                text_widget.configure(state='normal')
+                text_widget.delete('1.0', tk.END)
+                text_widget.insert(tk.END, "Counting words...")
+                text_widget.configure(state='disabled')
+                pending['after'] = dialog.after(self.WORD_CLOUD_POLL_MS, render)
+                return
+            
+            if scope.startswith("Note: ") and current_note is not None:
+                top_words = store.top_terms(self.WORD_CLOUD_SIZE, current_note.id,
+                                            min_length=4, stop_words=STOP_WORDS)
+            elif scope.startswith("Category: "):
+                top_words = store.top_terms(self.WORD_CLOUD_SIZE, category=scope[len("Category: "):],
+                                            min_length=4, stop_words=STOP_WORDS)
+            else:
+                top_words = store.top_terms(self.WORD_CLOUD_SIZE, min_length=4, stop_words=STOP_WORDS)
+            
+            text_widget.configure(state='normal')
+            text_widget.delete('1.0', tk.END)
+            if not top_words:
+                text_widget.insert(tk.END, "Not enough words to generate word cloud.")
+            else:
+                # Scale font size by frequency relative to the most frequent word
+                highest = top_words[0][1]
+                lowest = top_words[-1][1]
+                span = max(highest - lowest, 1)
+                chunks = []
+                for word, count in sorted(top_words):
+                    chunks.extend((f"{word} ", tags[(count - lowest) * (len(tags) - 1) // span]))
+                text_widget.insert(tk.END, *chunks)
+            text_widget.configure(state='disabled')
+        
+        def cancel_poll(event):
+            if event.widget is dialog and pending:
+                dialog.after_cancel(pending.pop('after'))
+        
+        scope_combo.bind('<<ComboboxSelected>>', render)
+        dialog.bind('<Destroy>', cancel_poll)
+        render()
         
         ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
     
@@ -509,8 +869,7 @@ Character Count: {note.char_count}\\\\
             }
             
             if include_stats:
-                analyzer = AdvancedTextAnalyzer()
-                stats = analyzer.analyze_text(note.content)
+                stats = self.text_analyzer.analyze_text(note.content)
                 data['statistics'] = stats
             
             try:
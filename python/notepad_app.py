@@ -1,15 +1,82 @@
+import time
+_MODULE_START = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog, colorchooser
 import json
 import os
 import re
+import sys
+import importlib
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import List, Optional, Dict, Any
-import webbrowser
 from pathlib import Path
 import threading
-import time
+import queue
+import inspect
+import bisect
+import functools
+import heapq
+import mmap
+import struct
+import math
+import zlib
+import hashlib
+from array import array
+from collections import deque, OrderedDict, Counter
+from contextlib import contextmanager
+
+# Time from module import to an idle, interactive window
+STARTUP_TARGET_MS = 300
+
+class StartupProfiler:
+    """Records startup phases and lazy imports for the --startup-report output"""
+    
+    def __init__(self, origin):
+        self.origin = origin
+        self.last_mark = origin
+        self.phases = []  # (name, self_ms, cumulative_ms)
+        self.imports = []  # (module, ms)
+    
+    def mark(self, phase):
+        """Close the current phase under the given name"""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last_mark) * 1000, (now - self.origin) * 1000))
+        self.last_mark = now
+    
+    def record_import(self, module_name, elapsed_ms):
+        self.imports.append((module_name, elapsed_ms))
+    
+    def total_ms(self):
+        return self.phases[-1][2] if self.phases else 0.0
+    
+    def report(self, target_ms=STARTUP_TARGET_MS):
+        """Format phases in the style of python -X importtime"""
+        lines = ["startup: self [ms] | cumulative [ms] | phase"]
+        for name, self_ms, cumulative_ms in self.phases:
+            lines.append(f"startup: {self_ms:9.1f} | {cumulative_ms:15.1f} | {name}")
+        for module_name, elapsed_ms in self.imports:
+            lines.append(f"lazy import: {elapsed_ms:9.1f} ms | {module_name}")
+        total = self.total_ms()
+        verdict = "OK" if total <= target_ms else "OVER TARGET"
+        lines.append(f"startup: total {total:.1f} ms (target {target_ms} ms) {verdict}")
+        return "\n".join(lines)
+
+startup_profile = StartupProfiler(_MODULE_START)
+
+def lazy_import(module_name):
+    """Import an optional module on first use, recording what it cost"""
+    module = sys.modules.get(module_name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        startup_profile.record_import(module_name, (time.perf_counter() - start) * 1000)
+    return module
+
+def content_hash(text):
+    """Short stable digest of note text, for caches keyed by content"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
 
 @dataclass
 class Note:
@@ -22,12 +89,17 @@ class Note:
     is_favorite: bool = False
     word_count: int = 0
     char_count: int = 0
+    # Last complete spell check: content hash, dictionary signature and
+    # [line, start_col, end_col, word] misspellings
+    spell_cache: Dict[str, Any] = field(default_factory=dict)
+    language: str = ""  # spell check language code; empty follows categories or detection
 
 @dataclass
 class Category:
     id: str
     name: str
     color: str
+    language: str = ""  # spell check language for notes in this category
 
 @dataclass
 class AppSettings:
@@ -40,20 +112,794 @@ class AppSettings:
     backup_enabled: bool = True
     backup_interval: int = 300  # 5 minutes
     spell_check_enabled: bool = True
+    spell_check_language: str = "en"  # used when a note has no language of its own
+    detect_note_language: bool = True
+    spell_dictionary_memory_mb: int = 64  # idle language dictionaries are dropped above this
     auto_correct: bool = False
+    large_document_threshold: int = 200000  # characters
+    large_document_chunk_size: int = 20000  # characters inserted per idle callback
+    large_document_paged_view: bool = False
+    large_document_page_lines: int = 500
+    show_statistics_panel: bool = False
+
+class LRUCache:
+    """Size-bounded mapping that evicts the least recently used entry
+    
+    get() counts hits and misses for the diagnostics dialog. on_evict, if
+    given, is called with each key pushed out by the size limit.
+    """
+    
+    def __init__(self, max_size, on_evict=None):
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, key):
+        return key in self.entries
+    
+    def get(self, key, default=None):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            evicted, _ = self.entries.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted)
+    
+    def pop(self, key, default=None):
+        return self.entries.pop(key, default)
+    
+    def clear(self):
+        self.entries.clear()
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+class WordList:
+    """Compact, sorted word set for large dictionaries
+    
+    Words are stored lowercase as one UTF-8 blob of newline-terminated
+    entries in byte order, plus an array of entry offsets, so membership is
+    a binary search and a 200k-word list costs a few MB instead of a Python
+    set of str objects. Compiled lists are saved as a binary cache that is
+    memory-mapped on the next start instead of being parsed again.
+    """
+    
+    MAGIC = b'NPWL'
+    FORMAT_VERSION = 1
+    # magic, version, little-endian flag, offset size, count, source size, source mtime, extra words CRC
+    HEADER = struct.Struct('<4sHBBIQQI')
+    RECENT_LOOKUPS = 4096
+    
+    def __init__(self, blob, offsets):
+        self.blob = blob  # bytes, or the mmap of a cache file
+        self.offsets = offsets  # entry start offsets into blob, plus the end offset
+        self.cache_path = None  # binary cache this list was loaded from or saved to
+        self._recent = {}
+    
+    @classmethod
+    def from_words(cls, words):
+        """Build a list from any iterable of words"""
+        encoded = sorted({word.lower().encode('utf-8') for word in words if word})
+        offsets = array('I', [0])
+        position = 0
+        for word in encoded:
+            position += len(word) + 1
+            offsets.append(position)
+        return cls(b''.join(word + b'\n' for word in encoded), offsets)
+    
+    @classmethod
+    def load(cls, source, cache_dir, extra_words=()):
+        """Load a word file through its binary cache, rebuilding the cache when stale"""
+        source = Path(source)
+        stat = source.stat()
+        extra_crc = zlib.crc32('\n'.join(sorted(extra_words)).encode('utf-8'))
+        cache_file = Path(cache_dir) / f"{source.stem}-{zlib.crc32(str(source).encode('utf-8')):08x}.wordlist"
+        
+        try:
+            words = cls.load_cache(cache_file, stat.st_size, stat.st_mtime_ns, extra_crc)
+            if words is not None:
+                words.cache_path = cache_file
+                return words
+        except (OSError, ValueError, struct.error):
+            pass
+        
+        words = cls.from_words(read_word_file(source) + list(extra_words))
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            words.save_cache(cache_file, stat.st_size, stat.st_mtime_ns, extra_crc)
+            words.cache_path = cache_file
+        except OSError as e:
+            print(f"Error saving dictionary cache: {e}")
+        return words
+    
+    @classmethod
+    def load_cache(cls, path, source_size, source_mtime_ns, extra_crc):
+        """Memory-map a cache file, or return None if it is missing or stale"""
+        if not Path(path).exists():
+            return None
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        (magic, version, little_endian, offset_size, count,
+         size, mtime_ns, crc) = cls.HEADER.unpack_from(data, 0)
+        if (magic != cls.MAGIC or version != cls.FORMAT_VERSION or
+                bool(little_endian) != (sys.byteorder == 'little') or
+                offset_size != array('I').itemsize or
+                (size, mtime_ns, crc) != (source_size, source_mtime_ns, extra_crc)):
+            data.close()
+            return None
+        
+        # Offsets in the cache are absolute, so entries slice straight out of the map
+        start = cls.HEADER.size
+        offsets = memoryview(data)[start:start + (count + 1) * offset_size].cast('I')
+        return cls(data, offsets)
+    
+    def save_cache(self, path, source_size, source_mtime_ns, extra_crc):
+        """Write the list as a cache file for load_cache"""
+        count = len(self)
+        header = self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, sys.byteorder == 'little',
+                                  array('I').itemsize, count, source_size, source_mtime_ns, extra_crc)
+        base = len(header) + (count + 1) * array('I').itemsize - self.offsets[0]
+        offsets = array('I', (offset + base for offset in self.offsets))
+        
+        temp_file = Path(path).with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(header)
+            f.write(offsets.tobytes())
+            f.write(self.blob[self.offsets[0]:self.offsets[-1]])
+        os.replace(temp_file, path)
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    def word_at(self, index):
+        return self.blob[self.offsets[index]:self.offsets[index + 1] - 1].decode('utf-8')
+    
+    def checksum(self):
+        """CRC-32 of the entries, identifying this exact list"""
+        return zlib.crc32(self.blob[self.offsets[0]:self.offsets[-1]])
+    
+    def __iter__(self):
+        text = self.blob[self.offsets[0]:self.offsets[-1]].decode('utf-8')
+        return iter(text.split('\n')[:-1])
+    
+    def __contains__(self, word):
+        found = self._recent.get(word)
+        if found is not None:
+            return found
+        
+        key = word.encode('utf-8')
+        blob, offsets = self.blob, self.offsets
+        low, high = 0, len(self)
+        found = False
+        while low < high:
+            middle = (low + high) // 2
+            entry = blob[offsets[middle]:offsets[middle + 1] - 1]
+            if entry < key:
+                low = middle + 1
+            elif entry > key:
+                high = middle
+            else:
+                found = True
+                break
+        
+        if len(self._recent) >= self.RECENT_LOOKUPS:
+            self._recent.clear()
+        self._recent[word] = found
+        return found
+    
+
+class WordListIndex:
+    """Memory-mapped multimap from lookup keys to the entries of a WordList
+    
+    Every (key, entry) pair is packed as CRC-32(key) << 32 | entry number
+    into one sorted array of 64-bit integers, so a lookup is a binary
+    search and the index lives in the page cache rather than in Python
+    objects. The array is saved next to the word list's binary cache and
+    memory-mapped on later starts. Hash collisions only add candidates,
+    which callers verify anyway.
+    """
+    
+    MAGIC = b'NPWI'
+    FORMAT_VERSION = 1
+    # magic, version, little-endian flag, entry count, word count, word list CRC, key scheme CRC
+    HEADER = struct.Struct('<4sHBxQIII')
+    
+    def __init__(self, words, entries):
+        self.words = words
+        self.entries = entries  # sorted array('Q') or a memoryview of a cache file
+    
+    @classmethod
+    def load(cls, words, keys_of, scheme, suffix):
+        """Index of words under keys_of(word), from its cache file when still valid
+        
+        scheme names the key function and its parameters; a cache built with
+        another scheme or another word list is rebuilt.
+        """
+        path = words.cache_path.with_suffix(suffix) if words.cache_path else None
+        scheme_crc = zlib.crc32(scheme.encode('utf-8'))
+        checksum = words.checksum()
+        if path is not None and path.exists():
+            try:
+                index = cls.load_cache(words, path, checksum, scheme_crc)
+                if index is not None:
+                    return index
+            except (OSError, ValueError, struct.error):
+                pass
+        
+        index = cls.build(words, keys_of)
+        if path is not None:
+            try:
+                index.save_cache(path, checksum, scheme_crc)
+            except OSError as e:
+                print(f"Error saving dictionary index: {e}")
+        return index
+    
+    @classmethod
+    def build(cls, words, keys_of):
+        crc32 = zlib.crc32
+        entries = array('Q')
+        for number, word in enumerate(words):
+            for key in keys_of(word):
+                entries.append(crc32(key.encode('utf-8')) << 32 | number)
+        np = optional_numpy()
+        if np is not None:
+            entries = array('Q', np.sort(np.frombuffer(entries, dtype=np.uint64)).tobytes())
+        else:
+            entries = array('Q', sorted(entries))
+        return cls(words, entries)
+    
+    @classmethod
+    def load_cache(cls, words, path, checksum, scheme_crc):
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, little_endian, count, word_count, words_crc, scheme = cls.HEADER.unpack_from(data, 0)
+        if (magic != cls.MAGIC or version != cls.FORMAT_VERSION or
+                bool(little_endian) != (sys.byteorder == 'little') or
+                (word_count, words_crc, scheme) != (len(words), checksum, scheme_crc) or
+                len(data) != cls.HEADER.size + 8 * count):
+            data.close()
+            return None
+        return cls(words, memoryview(data)[cls.HEADER.size:].cast('Q'))
+    
+    def save_cache(self, path, checksum, scheme_crc):
+        header = self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, sys.byteorder == 'little',
+                                  len(self.entries), len(self.words), checksum, scheme_crc)
+        temp_file = Path(path).with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(header)
+            f.write(self.entries.tobytes())
+        os.replace(temp_file, path)
+    
+    def lookup(self, key):
+        """Words filed under key (plus the odd hash collision)"""
+        hashed = zlib.crc32(key.encode('utf-8')) << 32
+        entries = self.entries
+        start = bisect.bisect_left(entries, hashed)
+        end = bisect.bisect_left(entries, hashed + (1 << 32), start)
+        return [self.words.word_at(entries[i] & 0xFFFFFFFF) for i in range(start, end)]
+    
+    def __len__(self):
+        return len(self.entries)
+
+def read_word_file(path):
+    """Words from a Hunspell .dic file or a plain one-word-per-line list"""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        lines = f.read().splitlines()
+    
+    # Hunspell dictionaries start with an approximate word count
+    if path.suffix == '.dic' and lines and lines[0].strip().isdigit():
+        lines = lines[1:]
+    
+    words = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        # Drop Hunspell affix flags ("word/FLAGS") and morphological fields
+        word = line.split()[0].split('/', 1)[0]
+        if word.isalpha():
+            words.append(word.lower())
+    return words
+
+@contextmanager
+def locked_file(path):
+    """Hold an exclusive lock on path, created if missing, across processes"""
+    with open(path, 'a+b') as lock:
+        if os.name == 'nt':
+            msvcrt = lazy_import('msvcrt')
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl = lazy_import('fcntl')
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+class CustomDictionary:
+    """User word list stored as an append-only log, one word per line
+    
+    Words are appended while holding a lock file, so several running
+    instances can add words safely, and each instance picks up the others'
+    additions by reading the log from its last offset. Once enough unsorted
+    lines have accumulated the log is rewritten sorted and de-duplicated.
+    Words live in a WordList, like the main dictionary, plus a small set of
+    words added since it was built.
+    """
+    
+    COMPACT_AFTER_LINES = 200
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock_path = self.path.with_suffix('.lock')
+        self.legacy_path = self.path.with_name("custom_dictionary.json")
+        self.words = WordList.from_words(())
+        self.recent = set()
+        self.offset = 0  # bytes of the log already read
+        self.file_id = None  # (device, inode) of the log, to notice rewrites
+        self.header = b''  # compaction stamp, since inodes can be reused
+        self.tail_lines = 0  # lines after the sorted, de-duplicated prefix
+    
+    def __contains__(self, word):
+        return word in self.recent or word in self.words
+    
+    def __iter__(self):
+        yield from self.words
+        yield from list(self.recent)
+    
+    def __len__(self):
+        return len(self.words) + len(self.recent)
+    
+    @staticmethod
+    def _header(first_line):
+        return first_line if first_line.startswith(b'#') else b''
+    
+    @staticmethod
+    def _parse(data):
+        words = []
+        for line in data.decode('utf-8', errors='ignore').splitlines():
+            word = line.strip().lower()
+            if word and not word.startswith('#'):
+                words.append(word)
+        return words
+    
+    def load(self):
+        """Read the whole log, first migrating an old custom_dictionary.json"""
+        if not self.path.exists() and not self.legacy_path.exists():
+            return
+        with locked_file(self.lock_path):
+            if not self.path.exists():
+                self._migrate_legacy()
+            self._read_all()
+            if self.tail_lines > self.COMPACT_AFTER_LINES:
+                self._compact()
+    
+    def _migrate_legacy(self):
+        with open(self.legacy_path, 'r', encoding='utf-8') as f:
+            words = sorted({word.lower() for word in json.load(f) if word})
+        self._write_sorted(words)
+        self.legacy_path.replace(self.legacy_path.with_name("custom_dictionary.json.bak"))
+    
+    def _read_all(self):
+        with open(self.path, 'rb') as f:
+            data = f.read()
+            stat = os.fstat(f.fileno())
+        words = self._parse(data)
+        
+        sorted_prefix = 0
+        for previous, word in zip([''] + words, words):
+            if word <= previous:
+                break
+            sorted_prefix += 1
+        
+        self.words = WordList.from_words(words)
+        self.recent = set()
+        self.offset = len(data)
+        self.file_id = (stat.st_dev, stat.st_ino)
+        self.header = self._header(data.split(b'\n', 1)[0])
+        self.tail_lines = len(words) - sorted_prefix
+    
+    def _read_changes(self):
+        """Apply lines other instances appended; returns the words new to us"""
+        if not self.path.exists():
+            return []
+        with open(self.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            rewritten = ((stat.st_dev, stat.st_ino) != self.file_id or stat.st_size < self.offset or
+                         self._header(f.readline().rstrip(b'\n')) != self.header)
+            if not rewritten:
+                f.seek(self.offset)
+                data = f.read()
+        
+        if rewritten:
+            known = set(self)
+            self._read_all()
+            return [word for word in self if word not in known]
+        
+        self.offset += len(data)
+        lines = self._parse(data)
+        self.tail_lines += len(lines)
+        new_words = [word for word in dict.fromkeys(lines) if word not in self]
+        self.recent.update(new_words)
+        return new_words
+    
+    def refresh(self):
+        """Pick up words appended by other instances; returns the new words"""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return []
+        if (stat.st_dev, stat.st_ino) == self.file_id and stat.st_size == self.offset:
+            return []
+        with locked_file(self.lock_path):
+            return self._read_changes()
+    
+    def add(self, word):
+        """Append a word to the log
+        
+        Returns every word new to this instance: the added word, if it was
+        not known yet, and any words other instances appended meanwhile.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with locked_file(self.lock_path):
+            new_words = self._read_changes()
+            if word not in self:
+                with open(self.path, 'ab') as f:
+                    f.write(word.encode('utf-8') + b'\n')
+                    self.offset = f.tell()
+                    stat = os.fstat(f.fileno())
+                if (stat.st_dev, stat.st_ino) != self.file_id:
+                    self.file_id = (stat.st_dev, stat.st_ino)
+                    self.header = b''  # the log was just created
+                self.recent.add(word)
+                self.tail_lines += 1
+                new_words.append(word)
+            
+            if self.tail_lines > self.COMPACT_AFTER_LINES:
+                self._compact()
+        return new_words
+    
+    def _compact(self):
+        self._write_sorted(sorted(set(self)))
+        self._read_all()
+    
+    def _write_sorted(self, words):
+        temp_file = self.path.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(f"# compacted {time.time_ns():x}\n".encode('utf-8'))
+            f.write(''.join(word + '\n' for word in words).encode('utf-8'))
+        os.replace(temp_file, self.path)
+
+def edit_distance(source, target, max_distance=None):
+    """Damerau (optimal string alignment) distance between two strings
+    
+    Uses Hyyro's bit-parallel algorithm: one column of the DP matrix is held
+    as bit vectors in Python ints, so each character of target costs a
+    handful of integer operations instead of a row of the table. With
+    max_distance set, returns max_distance + 1 as soon as the result is
+    known to exceed it.
+    """
+    if len(source) > len(target):
+        source, target = target, source
+    m, n = len(source), len(target)
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+    
+    # Bit i of match_masks[c] is set where source[i] == c
+    match_masks = {}
+    for i, char in enumerate(source):
+        match_masks[char] = match_masks.get(char, 0) | (1 << i)
+    
+    mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+    vertical_pos, vertical_neg = mask, 0
+    diagonal_zero, previous_match = 0, 0
+    distance = m
+    for j, char in enumerate(target):
+        match = match_masks.get(char, 0)
+        transposed = (((~diagonal_zero & match) << 1) & previous_match)
+        diagonal_zero = ((((match & vertical_pos) + vertical_pos) ^ vertical_pos)
+                         | match | vertical_neg | transposed) & mask
+        horizontal_pos = vertical_neg | (~(diagonal_zero | vertical_pos) & mask)
+        horizontal_neg = diagonal_zero & vertical_pos
+        if horizontal_pos & last_bit:
+            distance += 1
+        elif horizontal_neg & last_bit:
+            distance -= 1
+        horizontal_pos = (horizontal_pos << 1) | 1
+        horizontal_neg <<= 1
+        vertical_pos = (horizontal_neg | ~(diagonal_zero | horizontal_pos)) & mask
+        vertical_neg = horizontal_pos & diagonal_zero & mask
+        previous_match = match
+        
+        # Each remaining character can lower the distance by at most one
+        if max_distance is not None and distance - (n - j - 1) > max_distance:
+            return max_distance + 1
+    
+    return distance
+
+class SymSpellIndex:
+    """Symmetric-delete candidate index for spelling suggestions (SymSpell)
+    
+    Each word is filed under every string reachable by deleting up to
+    max_distance characters from its first prefix_length characters. A
+    lookup generates the same deletes for the query, so any word sharing a
+    key is a candidate; candidates are then verified with a real distance.
+    A large word list can be attached as a memory-mapped WordListIndex
+    built with delete_keys; it is searched alongside the in-memory words.
+    """
+    
+    def __init__(self, distance, max_distance=2, prefix_length=7):
+        self.distance = distance
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes = {}  # delete string -> word, or list of words when shared
+        self.mapped = None  # WordListIndex keyed by delete_keys
+        self.word_count = 0
+    
+    @property
+    def scheme(self):
+        """Names the key function, for validating a mapped index built from it"""
+        # Bumped from "symspell" when deletes started reaching the empty string
+        return f"symspell2:{self.max_distance}:{self.prefix_length}"
+    
+    def delete_keys(self, word):
+        return self._delete_variants(word[:self.prefix_length])
+    
+    def attach(self, mapped):
+        self.mapped = mapped
+        self.word_count += len(mapped.words)
+    
+    def _delete_variants(self, text):
+        variants = {text}
+        frontier = {text}
+        for _ in range(self.max_distance):
+            next_frontier = set()
+            for item in frontier:
+                # Deleting down to '' keeps one- and two-letter words reachable
+                for i in range(len(item)):
+                    next_frontier.add(item[:i] + item[i + 1:])
+            next_frontier -= variants
+            variants |= next_frontier
+            frontier = next_frontier
+        return variants
+    
+    def _entries(self, key):
+        entry = self.deletes.get(key)
+        if entry is None:
+            return ()
+        return (entry,) if isinstance(entry, str) else entry
+    
+    def add(self, word):
+        """Index a word; adding a word twice is a no-op"""
+        prefix = word[:self.prefix_length]
+        if word in self._entries(prefix):
+            return
+        
+        for key in self._delete_variants(prefix):
+            entry = self.deletes.get(key)
+            if entry is None:
+                self.deletes[key] = word
+            elif isinstance(entry, str):
+                self.deletes[key] = [entry, word]
+            else:
+                entry.append(word)
+        self.word_count += 1
+    
+    def remove(self, word):
+        """Drop a word from the index; removing an unknown word is a no-op"""
+        prefix = word[:self.prefix_length]
+        if word not in self._entries(prefix):
+            return
+        
+        for key in self._delete_variants(prefix):
+            entry = self.deletes.get(key)
+            if entry == word:
+                del self.deletes[key]
+            elif isinstance(entry, list) and word in entry:
+                entry.remove(word)
+                if len(entry) == 1:
+                    self.deletes[key] = entry[0]
+        self.word_count -= 1
+    
+    def lookup(self, word, max_distance=None):
+        """All indexed words within max_distance of word, as (word, distance) pairs"""
+        if max_distance is None:
+            max_distance = self.max_distance
+        max_distance = min(max_distance, self.max_distance)
+        
+        checked = {}
+        for key in self.delete_keys(word):
+            candidates = self._entries(key)
+            if self.mapped is not None:
+                candidates = list(candidates) + self.mapped.lookup(key)
+            for candidate in candidates:
+                if candidate in checked or abs(len(candidate) - len(word)) > max_distance:
+                    continue
+                checked[candidate] = self.distance(word, candidate, max_distance)
+        
+        return [(candidate, distance) for candidate, distance in checked.items()
+                if distance <= max_distance]
+
+# Soundex digit for each consonant; vowels, H, W, Y and digits are dropped
+_SOUNDEX_TABLE = str.maketrans(
+    'BFPVCGJKQSXZDTLMNR',
+    '111122222222334556',
+    'AEIOUHWY0123456789'
+)
+_NON_DIGITS = re.compile(r'\D')
+_REPEATED_DIGITS = re.compile(r'(\d)\1+')
+
+def soundex(word):
+    """Soundex code of a word, e.g. "robert" -> "R163" """
+    if not word:
+        return "0000"
+    
+    word = word.upper()
+    codes = _NON_DIGITS.sub('', word[1:].translate(_SOUNDEX_TABLE))
+    # Adjacent letters with the same code count once
+    codes = _REPEATED_DIGITS.sub(r'\1', codes)
+    return (word[0] + codes + "000")[:4]
+
+class PhoneticIndex:
+    """Words bucketed by phonetic code (Soundex by default)
+    
+    Codes are computed once per word when it is added, so a lookup is a
+    single dict access. Any encoder with the same signature, such as a
+    Metaphone implementation, can back the index instead. A large word
+    list can be attached as a memory-mapped WordListIndex keyed by code.
+    """
+    
+    def __init__(self, encoder=soundex):
+        self.encoder = encoder
+        self.buckets = {}  # code -> set of words
+        self.mapped = None  # WordListIndex keyed by encoder code
+    
+    @property
+    def scheme(self):
+        return f"phonetic:{self.encoder.__name__}"
+    
+    def codes(self, word):
+        return (self.encoder(word),)
+    
+    def attach(self, mapped):
+        self.mapped = mapped
+    
+    def add(self, word):
+        self.buckets.setdefault(self.encoder(word), set()).add(word)
+    
+    def remove(self, word):
+        code = self.encoder(word)
+        bucket = self.buckets.get(code)
+        if bucket is not None:
+            bucket.discard(word)
+            if not bucket:
+                del self.buckets[code]
+    
+    def lookup(self, word):
+        """Indexed words sharing word's phonetic code"""
+        code = self.encoder(word)
+        if self.mapped is None:
+            return self.buckets.get(code, ())
+        return self.buckets.get(code, set()).union(self.mapped.lookup(code))
 
 class SpellChecker:
     """Enhanced spell checker with suggestions and corrections"""
     
-    def __init__(self):
+    # Neighboring keys on a QWERTY keyboard, for ranking likely typos
+    KEYBOARD_NEIGHBORS = {
+        'q': 'wa', 'w': 'qes', 'e': 'wrd', 'r': 'etf', 't': 'ryg',
+        'y': 'tuh', 'u': 'yij', 'i': 'uok', 'o': 'ipl', 'p': 'ol',
+        'a': 'qsz', 's': 'awdx', 'd': 'sefc', 'f': 'drgv', 'g': 'fthb',
+        'h': 'gynj', 'j': 'hukm', 'k': 'jilm', 'l': 'kop',
+        'z': 'asx', 'x': 'zsdc', 'c': 'xdfv', 'v': 'cfgb', 'b': 'vghn',
+        'n': 'bhjm', 'm': 'njk'
+    }
+    
+    LANGUAGES = {'en': "English", 'de': "German", 'es': "Spanish"}
+    
+    # Word files searched for the main dictionary, most specific first
+    DICTIONARY_DIR = Path.home() / ".notepad_app" / "dictionaries"
+    DICTIONARY_CACHE_DIR = Path.home() / ".notepad_app" / "dictionary_cache"
+    SYSTEM_DICTIONARIES = {
+        'en': [Path("/usr/share/hunspell/en_US.dic"),
+               Path("/usr/share/myspell/en_US.dic"),
+               Path("/usr/share/dict/words")],
+        'de': [Path("/usr/share/hunspell/de_DE.dic"),
+               Path("/usr/share/myspell/de_DE.dic"),
+               Path("/usr/share/dict/ngerman")],
+        'es': [Path("/usr/share/hunspell/es_ES.dic"),
+               Path("/usr/share/myspell/es_ES.dic"),
+               Path("/usr/share/dict/spanish")],
+    }
+    SUGGESTION_CACHE_SIZE = 2000
+    
+    WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+    UNICODE_WORD_PATTERN = re.compile(r'\b[^\W\d_]+\b')
+    
+    def __init__(self, language='en'):
+        self.language = language
+        self.word_pattern = self.WORD_PATTERN if language == 'en' else self.UNICODE_WORD_PATTERN
         # Load dictionary
         self.dictionary = self.load_dictionary()
         self.custom_words = self.load_custom_dictionary()
-        self.suggestions_cache = {}
-        
+        self.suggestions_cache = LRUCache(self.SUGGESTION_CACHE_SIZE, on_evict=self._forget_cached_word)
+        # Cached misspellings, indexed like dictionary words so a new word
+        # finds exactly the cache entries it could appear in
+        self._cached_word_index = SymSpellIndex(distance=edit_distance)
+        self._cached_phonetic_index = PhoneticIndex()
+        self._suggestion_index = None
+        self._phonetic_index = None
+        # Suggestions are computed on the spell check worker and the Tk thread
+        self.lock = threading.RLock()
+    
+    def find_dictionary_file(self, language='en'):
+        """First available word file for a language, or None"""
+        candidates = [self.DICTIONARY_DIR / f"{language}.dic",
+                      self.DICTIONARY_DIR / f"{language}.txt"]
+        candidates += self.SYSTEM_DICTIONARIES.get(language, [])
+        for candidate in candidates:
+            if candidate.is_file() and candidate.stat().st_size > 0:
+                return candidate
+        return None
+    
     def load_dictionary(self):
-        """Load the main dictionary"""
-        # Common English words - in a real implementation, this would be loaded from a file
+        """Load the main dictionary from a word file, falling back to built-in words
+        
+        Also sets dictionary_signature, which changes whenever the loaded
+        words may have, so cached results can be recognised as stale.
+        """
+        # Only English has built-in words; other languages need a word file
+        builtin_words = self.load_builtin_words() if self.language == 'en' else set()
+        builtin_signature = f"{self.language}:builtin:{zlib.crc32(' '.join(sorted(builtin_words)).encode('utf-8')):08x}"
+        self.dictionary_signature = builtin_signature
+        source = self.find_dictionary_file(self.language)
+        self.available = source is not None or bool(builtin_words)
+        if source is None:
+            return builtin_words
+        try:
+            words = WordList.load(source, self.DICTIONARY_CACHE_DIR, extra_words=builtin_words)
+            stat = source.stat()
+            self.dictionary_signature = f"{source}:{stat.st_size}:{stat.st_mtime_ns}:{builtin_signature}"
+            return words
+        except Exception as e:
+            print(f"Error loading dictionary {source}: {e}")
+            return builtin_words
+    
+    def load_builtin_words(self):
+        """Small built-in word set used when no dictionary file is installed"""
         common_words = {
             "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by",
             "from", "up", "about", "into", "through", "during", "before", "after", "above",
@@ -195,25 +1041,23 @@ class SpellChecker:
     
     def load_custom_dictionary(self):
         """Load user's custom dictionary"""
+        custom_words = CustomDictionary(Path.home() / ".notepad_app" / "custom_dictionary.txt")
         try:
-            custom_dict_file = Path.home() / ".notepad_app" / "custom_dictionary.json"
-            if custom_dict_file.exists():
-                with open(custom_dict_file, 'r', encoding='utf-8') as f:
-                    return set(json.load(f))
-        except Exception:
-            pass
-        return set()
-    
-    def save_custom_dictionary(self):
-        """Save user's custom dictionary"""
-        try:
-            data_dir = Path.home() / ".notepad_app"
-            data_dir.mkdir(exist_ok=True)
-            custom_dict_file = data_dir / "custom_dictionary.json"
-            with open(custom_dict_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.custom_words), f, indent=2)
+            custom_words.load()
         except Exception as e:
-            print(f"Error saving custom dictionary: {e}")
+            print(f"Error loading custom dictionary: {e}")
+        return custom_words
+    
+    def refresh_custom_words(self):
+        """Pick up words other running instances added to the custom dictionary"""
+        with self.lock:
+            try:
+                new_words = self.custom_words.refresh()
+            except OSError as e:
+                print(f"Error reading custom dictionary: {e}")
+                return []
+            self._learn_words(new_words)
+            return new_words
     
     def is_word_correct(self, word):
         """Check if a word is spelled correctly"""
@@ -226,152 +1070,1402 @@ class SpellChecker:
                 word.isupper() or  # Acronyms
                 word.isdigit())    # Numbers
     
+    def find_misspellings(self, text, first_line=1):
+        """Misspelled words in text as (line, start_col, end_col, word) tuples"""
+        if not self.available:
+            return []  # no word list installed for this language
+        self.refresh_custom_words()
+        
+        # Offsets where each line starts, so positions convert by binary search
+        line_starts = [0]
+        line_starts.extend(match.end() for match in re.finditer('\n', text))
+        
+        # Words never span lines, so one lookup per word
+        misspellings = []
+        for match in self.word_pattern.finditer(text):
+            word = match.group()
+            if self.is_word_correct(word):
+                continue
+            
+            start_pos = match.start()
+            line_offset = bisect.bisect_right(line_starts, start_pos) - 1
+            start_col = start_pos - line_starts[line_offset]
+            misspellings.append((first_line + line_offset, start_col, start_col + len(word), word))
+        return misspellings
+    
+    @property
+    def suggestion_index(self):
+        """Symmetric-delete index over all known words, built on first use"""
+        if self._suggestion_index is None:
+            self._build_indexes()
+        return self._suggestion_index
+    
+    @property
+    def phonetic_index(self):
+        """Soundex buckets over all known words, built on first use"""
+        if self._phonetic_index is None:
+            self._build_indexes()
+        return self._phonetic_index
+    
+    def _build_indexes(self):
+        suggestion_index = SymSpellIndex(distance=edit_distance)
+        phonetic_index = PhoneticIndex()
+        sources = [self.custom_words]
+        if isinstance(self.dictionary, WordList):
+            # Word list indexes are too big for Python objects; they are
+            # built once, saved beside the word cache and memory-mapped
+            suggestion_index.attach(WordListIndex.load(
+                self.dictionary, suggestion_index.delete_keys, suggestion_index.scheme, '.deletes'))
+            phonetic_index.attach(WordListIndex.load(
+                self.dictionary, phonetic_index.codes, phonetic_index.scheme, '.phonetic'))
+        else:
+            sources.append(self.dictionary)
+        for words in sources:
+            for word in words:
+                suggestion_index.add(word)
+                phonetic_index.add(word)
+        self._suggestion_index = suggestion_index
+        self._phonetic_index = phonetic_index
+    
     def get_suggestions(self, word, max_suggestions=5):
         """Get spelling suggestions for a misspelled word"""
-        if word in self.suggestions_cache:
-            return self.suggestions_cache[word]
-        
+        with self.lock:
+            return self._get_suggestions(word, max_suggestions)
+    
+    def _get_suggestions(self, word, max_suggestions):
         word_lower = word.lower()
-        suggestions = []
-        
-        # Combine dictionary and custom words
-        all_words = self.dictionary.union(self.custom_words)
+        cached = self.suggestions_cache.get(word_lower)
+        if cached is not None:
+            return cached
         
-        # Find suggestions using different methods
-        suggestions.extend(self._get_edit_distance_suggestions(word_lower, all_words))
-        suggestions.extend(self._get_phonetic_suggestions(word_lower, all_words))
-        suggestions.extend(self._get_keyboard_suggestions(word_lower, all_words))
+        # Candidates within edit distance 2 come straight from the delete index
+        candidates = dict(self.suggestion_index.lookup(word_lower))
         
-        # Remove duplicates and sort by relevance
-        unique_suggestions = list(dict.fromkeys(suggestions))
+        # Sound-alike words a little further away come from the phonetic buckets
+        for suggestion, distance in self._get_phonetic_suggestions(word_lower):
+            candidates.setdefault(suggestion, distance)
         
-        # Score suggestions based on similarity
+        # Score suggestions; phonetic and keyboard signals only affect ranking
         scored_suggestions = []
-        for suggestion in unique_suggestions:
-            score = self._calculate_similarity_score(word_lower, suggestion)
+        for suggestion, distance in candidates.items():
+            score = self._calculate_similarity_score(word_lower, suggestion, distance)
             scored_suggestions.append((suggestion, score))
         
         # Sort by score and return top suggestions
-        scored_suggestions.sort(key=lambda x: x[1], reverse=True)
+        scored_suggestions.sort(key=lambda x: (-x[1], x[0]))
         final_suggestions = [s[0] for s in scored_suggestions[:max_suggestions]]
         
         # Cache the result
-        self.suggestions_cache[word] = final_suggestions
+        self.suggestions_cache.put(word_lower, final_suggestions)
+        self._cached_word_index.add(word_lower)
+        self._cached_phonetic_index.add(word_lower)
         return final_suggestions
     
-    def _get_edit_distance_suggestions(self, word, dictionary):
-        """Get suggestions based on edit distance"""
-        suggestions = []
-        for dict_word in dictionary:
-            if abs(len(word) - len(dict_word)) <= 2:  # Reasonable length difference
-                distance = self._levenshtein_distance(word, dict_word)
-                if distance <= 2:  # Allow up to 2 character differences
-                    suggestions.append(dict_word)
-        return suggestions
+    def _forget_cached_word(self, word):
+        self._cached_word_index.remove(word)
+        self._cached_phonetic_index.remove(word)
     
-    def _get_phonetic_suggestions(self, word, dictionary):
-        """Get suggestions based on phonetic similarity"""
-        suggestions = []
-        word_soundex = self._soundex(word)
-        for dict_word in dictionary:
-            if self._soundex(dict_word) == word_soundex:
-                suggestions.append(dict_word)
-        return suggestions
+    def _invalidate_suggestions(self, new_word):
+        """Drop cached suggestions that a newly known word could now appear in"""
+        affected = {cached for cached, _ in self._cached_word_index.lookup(new_word)}
+        affected.update(self._cached_phonetic_index.lookup(new_word))
+        for cached in affected:
+            self.suggestions_cache.pop(cached)
+            self._forget_cached_word(cached)
     
-    def _get_keyboard_suggestions(self, word, dictionary):
-        """Get suggestions based on keyboard layout (common typos)"""
-        keyboard_map = {
-            'q': 'wa', 'w': 'qes', 'e': 'wrd', 'r': 'etf', 't': 'ryg',
-            'y': 'tuh', 'u': 'yij', 'i': 'uok', 'o': 'ipl', 'p': 'ol',
-            'a': 'qsz', 's': 'awdx', 'd': 'sefc', 'f': 'drgv', 'g': 'fthb',
-            'h': 'gynj', 'j': 'hukm', 'k': 'jilm', 'l': 'kop',
-            'z': 'asx', 'x': 'zsdc', 'c': 'xdfv', 'v': 'cfgb', 'b': 'vghn',
-            'n': 'bhjm', 'm': 'njk'
-        }
-        
+    def _get_phonetic_suggestions(self, word, max_distance=3):
+        """Words with the same Soundex code within max_distance edits"""
         suggestions = []
-        for i, char in enumerate(word):
-            if char in keyboard_map:
-                for replacement in keyboard_map[char]:
-                    candidate = word[:i] + replacement + word[i+1:]
-                    if candidate in dictionary:
-                        suggestions.append(candidate)
+        for candidate in self.phonetic_index.lookup(word):
+            if abs(len(candidate) - len(word)) <= max_distance:
+                distance = edit_distance(word, candidate, max_distance)
+                if distance <= max_distance:
+                    suggestions.append((candidate, distance))
         return suggestions
     
-    def _levenshtein_distance(self, s1, s2):
-        """Calculate Levenshtein distance between two strings"""
-        if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+    def _is_keyboard_typo(self, word, candidate):
+        """True if candidate differs from word by one adjacent-key substitution"""
+        if len(word) != len(candidate):
+            return False
+        differences = [(a, b) for a, b in zip(word, candidate) if a != b]
+        return len(differences) == 1 and differences[0][1] in self.KEYBOARD_NEIGHBORS.get(differences[0][0], '')
+    
+    def _soundex(self, word):
+        """Generate Soundex code for phonetic matching"""
+        return soundex(word)
+    
+    def _calculate_similarity_score(self, word1, word2, distance=None):
+        """Calculate similarity score between two words
+        
+        Pass the distance measured during candidate generation to avoid
+        computing it again.
+        """
+        # Combine multiple factors for scoring
+        length_diff = abs(len(word1) - len(word2))
+        if distance is None:
+            distance = edit_distance(word1, word2)
+        
+        # Prefer words with similar length and fewer edits
+        score = 100 - (length_diff * 5) - (distance * 10)
         
-        if len(s2) == 0:
-            return len(s1)
+        # Bonus for common prefixes/suffixes
+        if word1.startswith(word2[:2]) or word2.startswith(word1[:2]):
+            score += 10
         
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+        # Bonus for words that sound alike or are a slip to a neighboring key
+        if self._soundex(word1) == self._soundex(word2):
+            score += 5
+        if self._is_keyboard_typo(word1, word2):
+            score += 5
         
-        return previous_row[-1]
+        return max(0, score)
     
-    def _soundex(self, word):
-        """Generate Soundex code for phonetic matching"""
-        if not word:
-            return "0000"
+    def add_to_dictionary(self, word):
+        """Add a word to the custom dictionary"""
+        with self.lock:
+            self._add_to_dictionary(word)
+    
+    def _add_to_dictionary(self, word):
+        if word and word.isalpha():
+            try:
+                new_words = self.custom_words.add(word.lower())
+            except OSError as e:
+                # Still accept the word for this session
+                print(f"Error saving custom dictionary: {e}")
+                self.custom_words.recent.add(word.lower())
+                new_words = [word.lower()]
+            self._learn_words(new_words)
+    
+    def memory_estimate(self):
+        """Rough bytes held by the dictionary, indexes and cache, for eviction"""
+        if isinstance(self.dictionary, WordList):
+            size = len(self.dictionary.blob) + 4 * len(self.dictionary.offsets)
+        else:
+            size = 80 * len(self.dictionary)  # set slot plus a short str
+        if self._suggestion_index is not None:
+            size += 120 * len(self._suggestion_index.deletes)
+            size += 80 * sum(len(bucket) for bucket in self._phonetic_index.buckets.values())
+        return size + 200 * len(self.suggestions_cache)
+    
+    def _learn_words(self, words):
+        for word in words:
+            if self._suggestion_index is not None:
+                self._suggestion_index.add(word)
+                self._phonetic_index.add(word)
+            # Only misspellings near the new word can get it as a suggestion
+            self._invalidate_suggestions(word)
+
+class DictionaryManager:
+    """Spell checkers per language, loaded on first use and shared by all notes
+    
+    When the estimated size of the loaded dictionaries and indexes goes over
+    the memory cap, the least recently used languages are dropped; the one
+    being asked for is always kept.
+    """
+    
+    def __init__(self, memory_cap_mb=64, on_load=None):
+        self.memory_cap = memory_cap_mb * 1024 * 1024
+        self.on_load = on_load  # callback(language, elapsed_ms)
+        self.checkers = OrderedDict()  # language -> SpellChecker, least recently used first
+        self.evictions = 0
+    
+    def get(self, language):
+        checker = self.checkers.get(language)
+        if checker is None:
+            start = time.perf_counter()
+            checker = SpellChecker(language)
+            if self.on_load is not None:
+                self.on_load(language, (time.perf_counter() - start) * 1000)
+            self.checkers[language] = checker
+            self.checkers.move_to_end(language)
+            self.evict_idle()
+        else:
+            self.checkers.move_to_end(language)
+        return checker
+    
+    def peek(self, language):
+        """The loaded checker for a language, without loading or touching it"""
+        return self.checkers.get(language)
+    
+    def memory_estimate(self):
+        return sum(checker.memory_estimate() for checker in self.checkers.values())
+    
+    def evict_idle(self):
+        """Drop least recently used checkers while over the memory cap"""
+        while len(self.checkers) > 1 and self.memory_estimate() > self.memory_cap:
+            self.checkers.popitem(last=False)
+            self.evictions += 1
+
+class LanguageDetector:
+    """Guesses a note's language from character trigram statistics
+    
+    Each language is profiled from the trigrams of its most common words,
+    which dominate running text. A text is scored by the mean log
+    likelihood of its trigrams under each profile, and only a clear winner
+    is reported. Results are cached by content hash, so each note is
+    analysed once.
+    """
+    
+    COMMON_WORDS = {
+        'en': "the of and to in is that it for was on are as with his they at be this have from or "
+              "one had by but not what all were we when your can said there an each which she do how "
+              "their if will up other about out many then them these so some her would make like him "
+              "into time has look two more could people my than first been who its now did get",
+        'de': "der die und in den von zu das mit sich des auf für ist im dem nicht ein eine als auch es "
+              "an werden aus er hat dass sie nach wird bei einer um am sind noch wie einem über einen so "
+              "zum war haben nur oder aber vor zur bis mehr durch man sein wurde sei ich wir ihr können "
+              "schon wenn sehr heute hier müssen würde gegen ohne unter jetzt immer",
+        'es': "de la que el en y a los del se las por un para con no una su al lo como más pero sus le "
+              "ya o este sí porque esta entre cuando muy sin sobre también me hasta hay donde quien "
+              "desde todo nos durante todos uno les ni contra otros ese eso ante ellos esto mí antes "
+              "algunos qué unos yo otro otras otra él tanto esa estos mucho nada muchos cual poco ella",
+    }
+    MIN_TRIGRAMS = 40  # shorter texts are not classified
+    SAMPLE_CHARS = 5000  # the start of a note is enough to tell
+    UNSEEN_FREQUENCY = 1e-4
+    MIN_MARGIN = 0.1  # mean log-likelihood lead over the runner-up
+    
+    def __init__(self):
+        self.profiles = {}
+        for language, words in self.COMMON_WORDS.items():
+            counts = self.trigrams(words)
+            total = sum(counts.values())
+            self.profiles[language] = {trigram: math.log(count / total) for trigram, count in counts.items()}
+        self.cache = LRUCache(256)
+    
+    @staticmethod
+    def trigrams(text):
+        counts = Counter()
+        for word in re.findall(r'[^\W\d_]+', text.lower()):
+            padded = f" {word} "
+            for i in range(len(padded) - 2):
+                counts[padded[i:i + 3]] += 1
+        return counts
+    
+    def detect(self, text):
+        """Most likely language code for text, or None if it can't tell"""
+        text = text[:self.SAMPLE_CHARS]
+        key = content_hash(text)
+        if key in self.cache:
+            return self.cache.get(key)
+        
+        counts = self.trigrams(text)
+        total = sum(counts.values())
+        language = None
+        if total >= self.MIN_TRIGRAMS:
+            unseen = math.log(self.UNSEEN_FREQUENCY)
+            scores = sorted(
+                (sum(count * profile.get(trigram, unseen) for trigram, count in counts.items()) / total, candidate)
+                for candidate, profile in self.profiles.items())
+            if scores[-1][0] - scores[-2][0] >= self.MIN_MARGIN:
+                language = scores[-1][1]
+        self.cache.put(key, language)
+        return language
+
+def note_language(note, categories, default_language, detector=None):
+    """Spell check language for a note
+    
+    An explicit note setting wins, then the first of its categories that
+    has a language, then detection from the text, then the default.
+    """
+    if note.language:
+        return note.language
+    for category in categories:
+        if category.language and category.name in note.categories:
+            return category.language
+    if detector is not None:
+        detected = detector.detect(note.content)
+        if detected:
+            return detected
+    return default_language
+
+class TaskScheduler:
+    """Cooperative scheduler for background work on the Tk event loop
+    
+    Tasks are callables; a task that returns a generator is resumed one step at
+    a time, so long jobs can yield between chunks. Each frame the scheduler runs
+    ready tasks in priority order until the frame budget is spent; a yield ends
+    the task's turn until the next frame, so tasks polling a queue do not spin.
+    Low priority tasks are held back while the user is typing.
+    """
+    
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+    
+    def __init__(self, root, frame_budget_ms=8, frame_interval_ms=16,
+                 typing_grace_ms=500, max_defer_ms=10000):
+        self.root = root
+        self.frame_budget = frame_budget_ms / 1000
+        self.frame_interval_ms = frame_interval_ms
+        self.typing_grace = typing_grace_ms / 1000
+        self.max_defer = max_defer_ms / 1000
+        self.tasks = {}  # name -> task record
+        self._sequence = 0
+        self._after_id = None
+        self._wake_time = None
+        self._last_input = 0.0
+        self.lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.deferred_count = 0
+    
+    def schedule(self, name, func, delay_ms=0, priority=NORMAL, interval_ms=None):
+        """Schedule func under name, replacing any pending task with that name"""
+        self._sequence += 1
+        self.tasks[name] = {
+            'func': func,
+            'priority': priority,
+            'due': time.monotonic() + delay_ms / 1000,
+            'interval': interval_ms / 1000 if interval_ms else None,
+            'generator': None,
+            'sequence': self._sequence
+        }
+        self._wake()
+    
+    def cancel(self, name):
+        """Cancel a pending or running task"""
+        task = self.tasks.pop(name, None)
+        if task and task['generator'] is not None:
+            task['generator'].close()
+    
+    def is_scheduled(self, name):
+        return name in self.tasks
+    
+    def notify_input(self):
+        """Record user input so low priority work is deferred"""
+        self._last_input = time.monotonic()
+    
+    def queue_depth(self):
+        """Number of tasks that are due and waiting to run"""
+        now = time.monotonic()
+        return sum(1 for task in self.tasks.values() if task['due'] <= now)
+    
+    def get_stats(self):
+        """Snapshot of scheduler health for diagnostics"""
+        return {
+            'pending_tasks': len(self.tasks),
+            'queue_depth': self.queue_depth(),
+            'lag_ms': round(self.lag_ms, 2),
+            'max_lag_ms': round(self.max_lag_ms, 2),
+            'deferred_count': self.deferred_count
+        }
+    
+    def stop(self):
+        """Cancel every task and the pending frame callback"""
+        for name in list(self.tasks):
+            self.cancel(name)
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def _is_deferred(self, task, now):
+        if task['priority'] < self.LOW or now - self._last_input >= self.typing_grace:
+            return False
+        # Never starve low priority work (auto-save) during long typing sessions
+        return now - task['due'] < self.max_defer
+    
+    def _next_task(self, now):
+        ready = None
+        for name, task in self.tasks.items():
+            if task['due'] > now:
+                continue
+            if self._is_deferred(task, now):
+                continue
+            if ready is None or (task['priority'], task['sequence']) < (ready[1]['priority'], ready[1]['sequence']):
+                ready = (name, task)
+        return ready
+    
+    def _run_frame(self):
+        now = time.monotonic()
+        self._after_id = None
+        if self._wake_time is not None:
+            self.lag_ms = max(0.0, (now - self._wake_time) * 1000)
+            self.max_lag_ms = max(self.max_lag_ms, self.lag_ms)
+        self._wake_time = None
+        
+        deadline = now + self.frame_budget
+        while now < deadline:
+            ready = self._next_task(now)
+            if ready is None:
+                break
+            self._step(*ready)
+            now = time.monotonic()
         
-        word = word.upper()
-        soundex = word[0]
+        if any(task['due'] <= now and self._is_deferred(task, now) for task in self.tasks.values()):
+            self.deferred_count += 1
+        self._wake()
+    
+    def _step(self, name, task):
+        try:
+            if task['generator'] is None:
+                result = task['func']()
+                if not inspect.isgenerator(result):
+                    self._finish(name, task)
+                    return
+                task['generator'] = result
+            next(task['generator'])
+            task['due'] = time.monotonic() + self.frame_interval_ms / 1000
+        except StopIteration:
+            self._finish(name, task)
+        except Exception as e:
+            print(f"Error in background task '{name}': {e}")
+            self._finish(name, task)
+    
+    def _finish(self, name, task):
+        # The task may have been replaced or cancelled while it was running
+        if self.tasks.get(name) is not task:
+            return
+        if task['interval']:
+            task['generator'] = None
+            task['due'] = time.monotonic() + task['interval']
+        else:
+            del self.tasks[name]
+    
+    def _wake(self):
+        """Arrange for the next frame at the earliest time any task can run"""
+        if not self.tasks:
+            return
         
-        # Soundex mapping
-        mapping = {
-            'BFPV': '1', 'CGJKQSXZ': '2', 'DT': '3',
-            'L': '4', 'MN': '5', 'R': '6'
+        now = time.monotonic()
+        wake_time = None
+        for task in self.tasks.values():
+            if task['due'] > now:
+                candidate = task['due']
+            elif self._is_deferred(task, now):
+                candidate = min(self._last_input + self.typing_grace, task['due'] + self.max_defer)
+            else:
+                candidate = now + self.frame_interval_ms / 1000
+            wake_time = candidate if wake_time is None else min(wake_time, candidate)
+        
+        if self._after_id and self._wake_time is not None and self._wake_time <= wake_time:
+            return
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+        self._wake_time = wake_time
+        self._after_id = self.root.after(max(0, int((wake_time - now) * 1000)), self._run_frame)
+
+class LatencyMonitor:
+    """Latency histograms for UI handlers plus an event-loop lag probe"""
+    
+    BUCKET_BOUNDS_MS = (1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000)
+    RECENT_SAMPLES = 500
+    
+    def __init__(self):
+        self.metrics = {}
+        self.started_at = datetime.now().isoformat()
+        self._probe_after_id = None
+    
+    def record(self, name, elapsed_ms):
+        """Add one latency sample (in milliseconds) to the named metric"""
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = {
+                'count': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'buckets': [0] * (len(self.BUCKET_BOUNDS_MS) + 1),
+                'recent': deque(maxlen=self.RECENT_SAMPLES)
+            }
+        metric['count'] += 1
+        metric['total_ms'] += elapsed_ms
+        metric['max_ms'] = max(metric['max_ms'], elapsed_ms)
+        metric['buckets'][bisect.bisect_left(self.BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        metric['recent'].append(elapsed_ms)
+    
+    @contextmanager
+    def measure(self, name):
+        """Context manager that records the wall time of its body"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+    
+    def start_lag_probe(self, root, interval_ms=250):
+        """Measure how late root.after callbacks fire compared to when they were due"""
+        def probe(expected):
+            now = time.perf_counter()
+            self.record('event_loop_lag', max(0.0, (now - expected) * 1000))
+            self._probe_after_id = root.after(interval_ms, probe, now + interval_ms / 1000)
+        
+        self._probe_after_id = root.after(interval_ms, probe, time.perf_counter() + interval_ms / 1000)
+    
+    def stop_lag_probe(self, root):
+        if self._probe_after_id:
+            root.after_cancel(self._probe_after_id)
+            self._probe_after_id = None
+    
+    def reset(self):
+        self.metrics.clear()
+        self.started_at = datetime.now().isoformat()
+    
+    def summary(self, name):
+        """Count, mean, percentiles and histogram for one metric"""
+        metric = self.metrics[name]
+        recent = sorted(metric['recent'])
+        
+        def percentile(p):
+            return recent[min(len(recent) - 1, int(len(recent) * p / 100))] if recent else 0.0
+        
+        labels = [f"<={bound}ms" for bound in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]}ms"]
+        return {
+            'count': metric['count'],
+            'mean_ms': round(metric['total_ms'] / max(metric['count'], 1), 3),
+            'p50_ms': round(percentile(50), 3),
+            'p95_ms': round(percentile(95), 3),
+            'p99_ms': round(percentile(99), 3),
+            'max_ms': round(metric['max_ms'], 3),
+            'histogram': dict(zip(labels, metric['buckets']))
+        }
+    
+    def snapshot(self):
+        return {name: self.summary(name) for name in sorted(self.metrics)}
+    
+    def dump_json(self, path, extra=None):
+        """Write all metrics to a JSON file for offline comparison between versions"""
+        platform = lazy_import('platform')
+        data = {
+            'app_version': '2.0',
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'started_at': self.started_at,
+            'dumped_at': datetime.now().isoformat(),
+            'metrics': self.snapshot()
+        }
+        if extra:
+            data.update(extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+def instrumented(name):
+    """Record the latency of an app method under name in self.latency"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.latency.measure(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+class ThemeEngine:
+    """Applies precomputed, cached style maps for each theme
+    
+    ttk styles are configured from a cached table in one pass. Classic Tk
+    widgets in dialogs pick up colors from the Tk option database, so new
+    windows are themed when they are created instead of being recolored.
+    Long-lived widgets registered with a role are reconfigured on a switch.
+    """
+    
+    PALETTES = {
+        'light': {
+            'bg': '#f8fafc', 'fg': '#1a202c', 'surface': '#ffffff', 'main': '#ffffff',
+            'accent': '#3182ce', 'header': '#f0f0f0', 'hover': '#e6f3ff',
+            'border': '#d0d0d0', 'muted': 'gray'
+        },
+        'dark': {
+            'bg': '#2d3748', 'fg': '#e2e8f0', 'surface': '#4a5568', 'main': '#2d3748',
+            'accent': '#3182ce', 'header': '#1a202c', 'hover': '#2c5282',
+            'border': '#718096', 'muted': '#a0aec0'
+        }
+    }
+    
+    def __init__(self, root, style):
+        self.root = root
+        self.style = style
+        self.current = None
+        self.widgets = []  # (widget, role)
+        self._cache = {}
+    
+    def palette(self, theme=None):
+        return self.PALETTES[theme or self.current or 'light']
+    
+    def compile(self, theme):
+        """Build (once) every style, option and widget setting for a theme"""
+        if theme in self._cache:
+            return self._cache[theme]
+        
+        p = self.PALETTES[theme]
+        styles = {
+            '.': {'background': p['bg'], 'foreground': p['fg'], 'fieldbackground': p['surface'],
+                  'selectbackground': p['accent'], 'bordercolor': p['border']},
+            'TFrame': {'background': p['bg']},
+            'TLabel': {'background': p['bg'], 'foreground': p['fg']},
+            'TButton': {'background': p['surface'], 'foreground': p['fg']},
+            'TCheckbutton': {'background': p['bg'], 'foreground': p['fg']},
+            'TLabelframe': {'background': p['bg']},
+            'TLabelframe.Label': {'background': p['bg'], 'foreground': p['fg']},
+            'TEntry': {'fieldbackground': p['surface'], 'foreground': p['fg']},
+            'TCombobox': {'fieldbackground': p['surface'], 'foreground': p['fg']},
+            'Treeview': {'background': p['surface'], 'fieldbackground': p['surface'], 'foreground': p['fg']},
+            'Title.TLabel': {'font': ('Arial', 18, 'bold'), 'background': p['bg'], 'foreground': p['fg']},
+            'Sidebar.TFrame': {'background': p['bg']},
+            'Main.TFrame': {'background': p['main']}
+        }
+        maps = {
+            'TButton': {'background': [('active', p['hover'])]},
+            'Treeview': {'background': [('selected', p['accent'])]}
+        }
+        # Tk option database entries; widgets created later inherit these
+        options = [
+            ('*Toplevel.background', p['surface']),
+            ('*Frame.background', p['surface']),
+            ('*Label.background', p['surface']),
+            ('*Label.foreground', p['fg']),
+            ('*Button.background', p['surface']),
+            ('*Button.foreground', p['fg']),
+            ('*Button.activeBackground', p['hover']),
+            ('*Radiobutton.background', p['surface']),
+            ('*Radiobutton.foreground', p['fg']),
+            ('*Radiobutton.selectColor', p['surface']),
+            ('*Radiobutton.activeBackground', p['hover']),
+            ('*Text.background', p['surface']),
+            ('*Text.foreground', p['fg']),
+            ('*Text.insertBackground', p['fg']),
+            ('*Text.selectBackground', p['accent']),
+            ('*Listbox.background', p['surface']),
+            ('*Listbox.foreground', p['fg']),
+            ('*Listbox.selectBackground', p['accent'])
+        ]
+        widgets = {
+            'root': {'bg': p['bg']},
+            'text': {'bg': p['surface'], 'fg': p['fg'], 'insertbackground': p['fg'],
+                     'selectbackground': p['accent']},
+            'listbox': {'bg': p['surface'], 'fg': p['fg'], 'selectbackground': p['accent']}
         }
         
-        for char in word[1:]:
-            for key, value in mapping.items():
-                if char in key:
-                    if soundex[-1] != value:  # Avoid consecutive duplicates
-                        soundex += value
-                    break
+        compiled = {'styles': styles, 'maps': maps, 'options': options, 'widgets': widgets}
+        self._cache[theme] = compiled
+        return compiled
+    
+    def apply(self, theme):
+        """Apply a theme in a single pass over its cached tables"""
+        compiled = self.compile(theme)
+        if self.style.theme_use() != 'clam':
+            self.style.theme_use('clam')
         
-        # Pad with zeros and truncate to 4 characters
-        soundex = (soundex + "0000")[:4]
-        return soundex
+        for style_name, options in compiled['styles'].items():
+            self.style.configure(style_name, **options)
+        for style_name, options in compiled['maps'].items():
+            self.style.map(style_name, **options)
+        for pattern, value in compiled['options']:
+            self.root.option_add(pattern, value)
+        
+        self.widgets = [(widget, role) for widget, role in self.widgets if widget.winfo_exists()]
+        for widget, role in self.widgets:
+            widget.configure(**compiled['widgets'][role])
+        self.current = theme
+    
+    def register(self, widget, role):
+        """Track a long-lived widget so theme switches recolor it"""
+        self.widgets.append((widget, role))
+        if self.current:
+            widget.configure(**self.compile(self.current)['widgets'][role])
+
+class MisspellingIndex:
+    """Misspelled word spans grouped by editor line
+    
+    Each line holds a list of (start_col, end_col, word) sorted by column, so
+    a click is resolved with a dict lookup and a bisect, and a re-checked
+    line range is replaced without scanning every stored entry.
+    """
+    
+    def __init__(self):
+        self.lines = {}  # line -> [(start_col, end_col, word), ...]
+    
+    def __len__(self):
+        return sum(len(spans) for spans in self.lines.values())
+    
+    def __iter__(self):
+        for line in sorted(self.lines):
+            for start_col, end_col, word in self.lines[line]:
+                yield self._word_info(line, start_col, end_col, word)
+    
+    @staticmethod
+    def _word_info(line, start_col, end_col, word):
+        return {'word': word, 'start': f"{line}.{start_col}", 'end': f"{line}.{end_col}"}
+    
+    def clear(self):
+        self.lines.clear()
+    
+    def clear_lines(self, first_line, last_line):
+        """Drop every span on lines first_line..last_line"""
+        if last_line - first_line < len(self.lines):
+            for line in range(first_line, last_line + 1):
+                self.lines.pop(line, None)
+        else:
+            for line in [line for line in self.lines if first_line <= line <= last_line]:
+                del self.lines[line]
+    
+    def add(self, line, start_col, end_col, word):
+        spans = self.lines.setdefault(line, [])
+        if spans and spans[-1][0] > start_col:
+            bisect.insort(spans, (start_col, end_col, word))
+        else:
+            spans.append((start_col, end_col, word))
+    
+    def remove(self, word_info):
+        """Remove the span starting at word_info['start'], if present"""
+        line, start_col = map(int, word_info['start'].split('.'))
+        spans = self.lines.get(line, [])
+        for i, span in enumerate(spans):
+            if span[0] == start_col:
+                del spans[i]
+                break
+        if not spans:
+            self.lines.pop(line, None)
+    
+    def find(self, line, col):
+        """Word info for the span containing (line, col), or None"""
+        spans = self.lines.get(line)
+        if not spans:
+            return None
+        i = bisect.bisect_right(spans, (col, float('inf'))) - 1
+        if i >= 0 and spans[i][0] <= col <= spans[i][1]:
+            return self._word_info(line, *spans[i])
+        return None
+    
+    def shift(self, edit_line, delta):
+        """Renumber lines after delta lines were inserted (or removed) below edit_line"""
+        shifted = {}
+        for line, spans in self.lines.items():
+            if line <= edit_line:
+                shifted[line] = spans
+            elif line + delta > edit_line:
+                shifted[line + delta] = spans
+            # Spans on removed lines are dropped; the edit line gets re-checked
+        self.lines = shifted
+
+class SpellCheckWorker:
+    """Spell checks editor text snapshots on a background thread
+    
+    The Tk thread submits (job_id, first_line, text) snapshots, each with
+    the spell checker for its note's language, and drains (job_id,
+    misspellings) results from a queue, dropping any whose lines changed
+    meanwhile. While no job is waiting, the worker computes
+    suggestions for the words it flagged so the suggestion popup opens from
+    the cache.
+    """
+    
+    PREFETCH_LIMIT = 50  # flagged words waiting for suggestions, newest kept
+    
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self._prefetch = deque(maxlen=self.PREFETCH_LIMIT)
+        self._thread = threading.Thread(target=self._run, name="spell-check-worker", daemon=True)
+        self._thread.start()
+    
+    def submit(self, job_id, first_line, text, spell_checker):
+        self.jobs.put((job_id, first_line, text, spell_checker))
+    
+    def stop(self):
+        self.jobs.put(None)
+    
+    def _next_job(self):
+        """Block for a job, prefetching suggestions while none is waiting"""
+        while self._prefetch:
+            try:
+                return self.jobs.get_nowait()
+            except queue.Empty:
+                spell_checker, word = self._prefetch.popleft()
+                if word.lower() not in spell_checker.suggestions_cache:
+                    spell_checker.get_suggestions(word)
+        return self.jobs.get()
+    
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            
+            job_id, first_line, text, spell_checker = job
+            try:
+                misspellings = spell_checker.find_misspellings(text, first_line)
+            except Exception as e:
+                print(f"Error checking spelling: {e}")
+                misspellings = []
+            self.results.put((job_id, misspellings))
+            
+            # Newest words first: they are the ones on screen
+            flagged = dict.fromkeys(word for _, _, _, word in misspellings)
+            self._prefetch.extendleft((spell_checker, word) for word in reversed(list(flagged)))
+
+# Notes per process pool task; large enough that pickling overhead is noise
+BATCH_SPELL_CHECK_SIZE = 100
+
+_batch_spell_checkers = {}  # language -> SpellChecker, per pool worker
+
+def _check_notes_batch(batch, with_spell_cache):
+    """Spell check (note_id, title, content, language) tuples in a pool worker"""
+    results = []
+    for note_id, title, content, language in batch:
+        # Each worker maps a language's cached dictionary once
+        checker = _batch_spell_checkers.get(language)
+        if checker is None:
+            checker = _batch_spell_checkers[language] = SpellChecker(language)
+        misspellings = checker.find_misspellings(content)
+        counts = Counter(word.lower() for _, _, _, word in misspellings)
+        result = {
+            'id': note_id,
+            'title': title,
+            'count': len(misspellings),
+            'words': counts.most_common(),
+        }
+        if with_spell_cache:
+            result['spell_cache'] = {
+                'content_hash': content_hash(content),
+                'dictionary': checker.dictionary_signature,
+                'misspellings': [list(misspelling) for misspelling in misspellings],
+            }
+        results.append(result)
+    return results
+
+def batch_spell_check(notes, max_workers=None, batch_size=BATCH_SPELL_CHECK_SIZE, with_spell_cache=False):
+    """Spell check (note_id, title, content, language) tuples across a process pool
+    
+    Yields one result dict per note as batches finish, so callers can
+    stream a report; with_spell_cache adds a Note.spell_cache entry to each.
+    notes is consumed lazily and only a few batches per worker are in
+    flight at a time, which keeps memory flat on very large stores. Each
+    worker maps a language's binary dictionary cache when it first meets
+    it, building the cache if it is missing.
+    """
+    futures_module = lazy_import('concurrent.futures')
+    multiprocessing = lazy_import('multiprocessing')
+    
+    notes = iter(notes)
+    max_workers = max_workers or os.cpu_count() or 1
+    # Spawned workers don't inherit the Tk connection or other threads
+    with futures_module.ProcessPoolExecutor(max_workers=max_workers,
+                                            mp_context=multiprocessing.get_context('spawn')) as pool:
+        pending = set()
+        while True:
+            while len(pending) < max_workers * 2:
+                batch = [note for _, note in zip(range(batch_size), notes)]
+                if not batch:
+                    break
+                pending.add(pool.submit(_check_notes_batch, batch, with_spell_cache))
+            if not pending:
+                return
+            
+            done, pending = futures_module.wait(pending, return_when=futures_module.FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+def print_batch_spell_check_report(data_dir, max_workers=None, out=sys.stdout):
+    """Headless --spell-check-all: stream a per-note misspelling report"""
+    settings = AppSettings()
+    try:
+        with open(Path(data_dir) / "notes.json", 'r', encoding='utf-8') as f:
+            data = json.load(f)
+            notes = [Note(**note_data) for note_data in data.get('notes', [])]
+            categories = [Category(**cat_data) for cat_data in data.get('categories', [])]
+        settings_file = Path(data_dir) / "settings.json"
+        if settings_file.exists():
+            with open(settings_file, 'r', encoding='utf-8') as f:
+                for key, value in json.load(f).items():
+                    if hasattr(settings, key):
+                        setattr(settings, key, value)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Error loading data: {e}", file=sys.stderr)
+        return 1
+    
+    detector = LanguageDetector() if settings.detect_note_language else None
+    start = time.perf_counter()
+    totals = Counter()
+    notes_with_errors = 0
+    for result in batch_spell_check(
+            ((note.id, note.title, note.content,
+              note_language(note, categories, settings.spell_check_language, detector)) for note in notes),
+            max_workers=max_workers):
+        if not result['count']:
+            continue
+        notes_with_errors += 1
+        totals.update(dict(result['words']))
+        words = ", ".join(f"{word} ({count})" for word, count in result['words'][:10])
+        print(f"{result['title']} [{result['id']}]: {result['count']} misspellings - {words}", file=out, flush=True)
+    
+    elapsed = time.perf_counter() - start
+    print(f"\nChecked {len(notes)} notes in {elapsed:.1f} s: {notes_with_errors} with misspellings, "
+          f"{sum(totals.values())} misspellings in total", file=out)
+    if totals:
+        print("Most common: " + ", ".join(f"{word} ({count})" for word, count in totals.most_common(20)), file=out)
+    return 0
+
+def optional_numpy():
+    """numpy if it is installed, else None (callers fall back to pure Python)"""
+    try:
+        return lazy_import('numpy')
+    except ImportError:
+        return None
+
+def _note_metrics_batch(batch):
+    """Metrics for (content hash, content) pairs in a pool worker"""
+    TextTokenizer = lazy_import('enhanced_features').TextTokenizer
+    results = []
+    for key, content in batch:
+        stats = TextTokenizer.analyze(content)
+        results.append((key, {
+            'words': stats.word_count,
+            'characters': stats.character_count,
+            'sentences': stats.sentence_count,
+            'reading_ease': stats.flesch_reading_ease,
+            'vocabulary': list(stats.word_frequency)
+        }))
+    return results
+
+class CorpusAnalytics:
+    """Writing metrics across all notes for the analytics dashboard
+    
+    Per-note metrics are cached by content hash, so after edits only the
+    changed notes are re-analyzed. Large backlogs go to a process pool.
+    Aggregation uses numpy when it is installed and plain Python otherwise.
+    """
+    
+    BATCH_SIZE = 200
+    POOL_THRESHOLD = 500  # below this many notes to analyze, starting workers costs more than it saves
+    READING_EASE_BOUNDS = (30, 50, 60, 70, 80, 90)
+    READING_LEVELS = ("Very Difficult", "Difficult", "Fairly Difficult", "Standard",
+                      "Fairly Easy", "Easy", "Very Easy")
+    
+    def __init__(self):
+        self.metrics = {}  # content hash -> metrics dict
+        self.lock = threading.Lock()
+    
+    def analyze(self, notes, max_workers=None, progress=None):
+        """Dashboard series for (content, created_at, categories) tuples
+        
+        Returns (number of notes analyzed rather than cached, series dict);
+        progress, if given, is called with the number analyzed so far.
+        """
+        keys = [content_hash(content) for content, _, _ in notes]
+        with self.lock:
+            analyzed = self.update(keys, [content for content, _, _ in notes], max_workers, progress)
+            return analyzed, self.aggregate(notes, [self.metrics[key] for key in keys])
+    
+    def update(self, keys, contents, max_workers=None, progress=None):
+        """Analyze contents whose hash is not cached; returns how many were analyzed"""
+        missing = {}
+        for key, content in zip(keys, contents):
+            if key not in self.metrics:
+                missing[key] = content
+        # Drop entries for content that no longer exists
+        live = set(keys)
+        for key in [key for key in self.metrics if key not in live]:
+            del self.metrics[key]
+        
+        items = list(missing.items())
+        batches = [items[i:i + self.BATCH_SIZE] for i in range(0, len(items), self.BATCH_SIZE)]
+        done = 0
+        
+        def store(batch_results):
+            nonlocal done
+            self.metrics.update(batch_results)
+            done += len(batch_results)
+            if progress:
+                progress(done)
+        
+        if len(items) < self.POOL_THRESHOLD:
+            for batch in batches:
+                store(_note_metrics_batch(batch))
+        else:
+            futures_module = lazy_import('concurrent.futures')
+            multiprocessing = lazy_import('multiprocessing')
+            with futures_module.ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                                                    mp_context=multiprocessing.get_context('spawn')) as pool:
+                for batch_results in pool.map(_note_metrics_batch, batches):
+                    store(batch_results)
+        return len(items)
+    
+    def aggregate(self, notes, metrics):
+        """Dashboard series from note tuples and their metrics, in the same order"""
+        np = optional_numpy()
+        months = sorted({created_at[:7] for _, created_at, _ in notes})
+        month_index = {month: i for i, month in enumerate(months)}
+        note_months = [month_index[created_at[:7]] for _, created_at, _ in notes]
+        words = [m['words'] for m in metrics]
+        
+        # Notes in several categories count towards each of them
+        categories = sorted({category for _, _, note_categories in notes for category in note_categories})
+        category_index = {category: i for i, category in enumerate(categories)}
+        category_notes = [(category_index[category], i)
+                          for i, (_, _, note_categories) in enumerate(notes) for category in note_categories]
+        
+        scores = [m['reading_ease'] for m in metrics if m['reading_ease'] is not None]
+        
+        if np is not None:
+            words_array = np.array(words, dtype=np.int64)
+            words_by_month = np.bincount(np.array(note_months, dtype=np.intp), weights=words_array,
+                                         minlength=len(months)).astype(np.int64).tolist()
+            if category_notes:
+                category_ids, note_ids = np.array(category_notes, dtype=np.intp).T
+                words_by_category = np.bincount(category_ids, weights=words_array[note_ids],
+                                                minlength=len(categories)).astype(np.int64).tolist()
+            else:
+                words_by_category = []
+            levels = np.bincount(np.searchsorted(self.READING_EASE_BOUNDS, np.array(scores, dtype=float),
+                                                 side='right'),
+                                 minlength=len(self.READING_LEVELS)).tolist()
+            total_words = int(words_array.sum())
+        else:
+            words_by_month = [0] * len(months)
+            for month, count in zip(note_months, words):
+                words_by_month[month] += count
+            words_by_category = [0] * len(categories)
+            for category, note in category_notes:
+                words_by_category[category] += words[note]
+            levels = [0] * len(self.READING_LEVELS)
+            for score in scores:
+                levels[bisect.bisect_right(self.READING_EASE_BOUNDS, score)] += 1
+            total_words = sum(words)
+        
+        # Distinct words seen up to the end of each month
+        vocabulary = set()
+        vocabulary_growth = []
+        by_month = sorted(range(len(notes)), key=note_months.__getitem__)
+        position = 0
+        for month in range(len(months)):
+            while position < len(by_month) and note_months[by_month[position]] == month:
+                vocabulary.update(metrics[by_month[position]]['vocabulary'])
+                position += 1
+            vocabulary_growth.append(len(vocabulary))
+        
+        return {
+            'total_notes': len(notes),
+            'total_words': total_words,
+            'total_characters': sum(m['characters'] for m in metrics),
+            'vocabulary_size': len(vocabulary),
+            'words_by_month': list(zip(months, words_by_month)),
+            'words_by_category': list(zip(categories, words_by_category)),
+            'vocabulary_growth': list(zip(months, vocabulary_growth)),
+            'reading_levels': list(zip(self.READING_LEVELS, levels)),
+            'unrated_notes': len(notes) - len(scores)
+        }
+
+class TermFrequencyStore:
+    """Global and per-note word counts, maintained from paragraph deltas
+    
+    Each note is held as a multiset of paragraph hashes; word counts are
+    kept once per distinct paragraph, so notes built from the same template
+    share them. When a note changes, only paragraphs that appeared or
+    disappeared are counted and added to or subtracted from the note,
+    category and global totals. Notes are matched by their updated_at stamp
+    and categories, so checking an unchanged store is a dictionary lookup
+    per note.
+    """
+    
+    TERM_PATTERN = re.compile(r'\w+')  # the same words TextTokenizer counts
+    FILE_VERSION = 1
+    
+    def __init__(self, path=None):
+        self.path = path
+        self.paragraph_terms = {}  # paragraph hash -> Counter
+        self.paragraph_refs = Counter()  # paragraph hash -> number of uses across notes
+        self.notes = {}  # note id -> {'stamp', 'categories', 'paragraphs': Counter of hashes}
+        self.note_terms = {}  # note id -> Counter
+        self.category_terms = {}  # category -> Counter
+        self.terms = Counter()
+        self.dirty = False
+    
+    @classmethod
+    def load(cls, path):
+        """Store persisted at path, or an empty one"""
+        store = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != cls.FILE_VERSION:
+                return store
+            store.paragraph_terms = {key: Counter(terms) for key, terms in data['paragraphs'].items()}
+            for note_id, entry in data['notes'].items():
+                paragraphs = Counter(entry['paragraphs'])
+                categories = list(entry.get('categories', []))
+                store.notes[note_id] = {'stamp': entry['stamp'], 'categories': categories,
+                                        'paragraphs': paragraphs}
+                terms = store.note_terms[note_id] = Counter()
+                for key, count in paragraphs.items():
+                    store._apply(terms, store.paragraph_terms[key], count)
+                    store.paragraph_refs[key] += count
+                store.terms.update(terms)
+                for category in categories:
+                    store.category_terms.setdefault(category, Counter()).update(terms)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Error loading term frequencies: {e}")
+            return cls(path)
+        return store
+    
+    def save(self):
+        if not self.dirty or self.path is None:
+            return
+        # Paragraphs no longer used by any note are dropped when saving
+        for key in [key for key in self.paragraph_terms if not self.paragraph_refs[key]]:
+            del self.paragraph_terms[key]
+        data = {
+            'version': self.FILE_VERSION,
+            'notes': {note_id: {'stamp': entry['stamp'], 'categories': entry['categories'],
+                                'paragraphs': dict(entry['paragraphs'])}
+                      for note_id, entry in self.notes.items()},
+            'paragraphs': {key: dict(terms) for key, terms in self.paragraph_terms.items()}
+        }
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            self.dirty = False
+        except OSError as e:
+            print(f"Error saving term frequencies: {e}")
+    
+    @staticmethod
+    def _apply(terms, delta, times):
+        """Add delta to terms times times (negative to subtract), dropping zero counts"""
+        for term, count in delta.items():
+            total = terms[term] + count * times
+            if total:
+                terms[term] = total
+            else:
+                del terms[term]
+    
+    def _move_categories(self, note_id, old, new):
+        """Move a note's counts from the old categories' totals to the new ones'"""
+        terms = self.note_terms[note_id]
+        for category in old:
+            # Empty totals are dropped, though empty notes may still be filed there
+            category_terms = self.category_terms.get(category)
+            if category_terms is None:
+                continue
+            self._apply(category_terms, terms, -1)
+            if not category_terms:
+                del self.category_terms[category]
+        for category in new:
+            self._apply(self.category_terms.setdefault(category, Counter()), terms, 1)
+    
+    def update(self, note_id, content, stamp, categories=()):
+        """Bring one note's counts up to date with content and categories"""
+        categories = list(categories)
+        paragraphs = {}
+        new = Counter()
+        for paragraph in content.split('\n\n'):
+            key = content_hash(paragraph)
+            paragraphs[key] = paragraph
+            new[key] += 1
+        
+        entry = self.notes.get(note_id)
+        old = entry['paragraphs'] if entry else Counter()
+        if entry:
+            # Category totals are re-added below once the note's own counts are current
+            self._move_categories(note_id, entry['categories'], ())
+        terms = self.note_terms.setdefault(note_id, Counter())
+        removed, added = old - new, new - old
+        for key, count in removed.items():
+            self._apply(terms, self.paragraph_terms[key], -count)
+            self._apply(self.terms, self.paragraph_terms[key], -count)
+        self._apply(self.paragraph_refs, removed, -1)
+        for key, count in added.items():
+            paragraph_terms = self.paragraph_terms.get(key)
+            if paragraph_terms is None:
+                paragraph_terms = self.paragraph_terms[key] = Counter(
+                    self.TERM_PATTERN.findall(paragraphs[key].lower()))
+            self._apply(terms, paragraph_terms, count)
+            self._apply(self.terms, paragraph_terms, count)
+        self._apply(self.paragraph_refs, added, 1)
+        
+        self._move_categories(note_id, (), categories)
+        self.notes[note_id] = {'stamp': stamp, 'categories': categories, 'paragraphs': new}
+        self.dirty = True
+    
+    def remove(self, note_id):
+        entry = self.notes.pop(note_id, None)
+        if entry is None:
+            return
+        self._move_categories(note_id, entry['categories'], ())
+        self._apply(self.terms, self.note_terms.pop(note_id), -1)
+        self._apply(self.paragraph_refs, entry['paragraphs'], -1)
+        self.dirty = True
+    
+    def sync_note(self, note):
+        """Update note's counts if it changed since it was last seen; returns whether it did"""
+        entry = self.notes.get(note.id)
+        if entry is not None and entry['stamp'] == note.updated_at:
+            if entry['categories'] == note.categories:
+                return False
+            # Categories changed without an edit: re-file the counts, no re-counting
+            self._move_categories(note.id, entry['categories'], note.categories)
+            entry['categories'] = list(note.categories)
+            self.dirty = True
+            return True
+        self.update(note.id, note.content, note.updated_at, note.categories)
+        return True
+    
+    def sync_steps(self, notes, notes_per_step=50):
+        """Generator that syncs the store with notes, yielding every few updated notes"""
+        notes = list(notes)
+        live = set()
+        updated = 0
+        for note in notes:
+            live.add(note.id)
+            if self.sync_note(note):
+                updated += 1
+                if updated % notes_per_step == 0:
+                    yield
+        for note_id in [note_id for note_id in self.notes if note_id not in live]:
+            self.remove(note_id)
+    
+    def sync(self, notes):
+        for _ in self.sync_steps(notes):
+            pass
+    
+    def top_terms(self, k, note_id=None, min_length=1, stop_words=frozenset(), category=None):
+        """The k most frequent (term, count) pairs, globally, for one note or for a category
+        
+        A bounded heap over the stored counts; no note text is re-read.
+        """
+        if note_id is not None:
+            terms = self.note_terms.get(note_id, Counter())
+        elif category is not None:
+            terms = self.category_terms.get(category, Counter())
+        else:
+            terms = self.terms
+        return heapq.nlargest(k, ((term, count) for term, count in terms.items()
+                                  if len(term) >= min_length and term not in stop_words),
+                              key=lambda item: item[1])
+
+class DuplicateFinder:
+    """Near-duplicate notes by MinHash signatures and locality-sensitive hashing
     
-    def _calculate_similarity_score(self, word1, word2):
-        """Calculate similarity score between two words"""
-        # Combine multiple factors for scoring
-        length_diff = abs(len(word1) - len(word2))
-        edit_distance = self._levenshtein_distance(word1, word2)
-        
-        # Prefer words with similar length and fewer edits
-        score = 100 - (length_diff * 5) - (edit_distance * 10)
-        
-        # Bonus for common prefixes/suffixes
-        if word1.startswith(word2[:2]) or word2.startswith(word1[:2]):
-            score += 10
-        
-        return max(0, score)
+    Notes are reduced to sets of word shingles. Signatures use one hash per
+    shingle spread over SIGNATURE_SIZE bins (one-permutation MinHash with
+    rotation for empty bins), which is cheap enough in pure Python, and are
+    cached by content hash. Signatures are split into LSH bands; only notes
+    sharing a band bucket are compared, by exact Jaccard similarity of
+    their shingles. Identical contents are grouped up front.
+    """
     
-    def add_to_dictionary(self, word):
-        """Add a word to the custom dictionary"""
-        if word and word.isalpha():
-            self.custom_words.add(word.lower())
-            self.save_custom_dictionary()
-            # Clear cache to include new word
-            self.suggestions_cache.clear()
+    SHINGLE_WORDS = 3
+    SIGNATURE_SIZE = 64
+    BANDS = 16  # 4 rows per band: pairs above ~0.5 similarity are very likely to collide
+    BIN_BITS = 6  # log2(SIGNATURE_SIZE)
+    EMPTY = 1 << 32
+    WORD_PATTERN = re.compile(r'\w+')
+    
+    def __init__(self):
+        self.signatures = {}  # content hash -> signature tuple, or None for notes without words
+        self.lock = threading.Lock()
+    
+    def shingles(self, content):
+        words = self.WORD_PATTERN.findall(content.lower())
+        if len(words) < self.SHINGLE_WORDS:
+            return {' '.join(words)} if words else set()
+        return {' '.join(words[i:i + self.SHINGLE_WORDS]) for i in range(len(words) - self.SHINGLE_WORDS + 1)}
+    
+    def signature(self, shingles):
+        size = self.SIGNATURE_SIZE
+        bins = [self.EMPTY] * size
+        mask = size - 1
+        for shingle in shingles:
+            value = zlib.crc32(shingle.encode('utf-8'))
+            index = value & mask
+            value >>= self.BIN_BITS
+            if value < bins[index]:
+                bins[index] = value
+        # Empty bins borrow the next filled bin to the right, offset by the
+        # distance, so sparse notes don't match on shared empty bins
+        filled = [i for i in range(size) if bins[i] != self.EMPTY]
+        if not filled:
+            return None
+        signature = list(bins)
+        for i in range(size):
+            if bins[i] == self.EMPTY:
+                nearest = filled[bisect.bisect_left(filled, i) % len(filled)]
+                signature[i] = bins[nearest] + ((nearest - i) % size) * self.EMPTY
+        return tuple(signature)
+    
+    def find(self, notes, threshold=0.8):
+        """Groups of near-duplicate notes among (note id, content) pairs
+        
+        Returns a list of (similarity, [note ids]) sorted most similar first,
+        where similarity is the lowest pairwise Jaccard similarity that
+        linked the group.
+        """
+        by_content = {}
+        for note_id, content in notes:
+            by_content.setdefault(content_hash(content), []).append((note_id, content))
+        
+        with self.lock:
+            for key, members in by_content.items():
+                if key not in self.signatures:
+                    self.signatures[key] = self.signature(self.shingles(members[0][1]))
+            live = set(by_content)
+            for key in [key for key in self.signatures if key not in live]:
+                del self.signatures[key]
+            signatures = {key: self.signatures[key] for key in by_content}
+        
+        # Band buckets: contents sharing any band are candidates
+        rows = self.SIGNATURE_SIZE // self.BANDS
+        buckets = {}
+        for key, signature in signatures.items():
+            if signature is None:
+                continue
+            for band in range(self.BANDS):
+                buckets.setdefault((band, signature[band * rows:(band + 1) * rows]), []).append(key)
+        
+        candidates = set()
+        for keys in buckets.values():
+            for i in range(len(keys)):
+                for j in range(i + 1, len(keys)):
+                    candidates.add((keys[i], keys[j]) if keys[i] < keys[j] else (keys[j], keys[i]))
+        
+        # Confirm candidates exactly and join them into groups (union-find)
+        parent = {}
+        linked = set()
+        
+        def root(key):
+            while key in parent:
+                key = parent[key]
+            return key
+        
+        shingle_sets = {}
+        similarity = {}
+        for first, second in candidates:
+            for key in (first, second):
+                if key not in shingle_sets:
+                    shingle_sets[key] = self.shingles(by_content[key][0][1])
+            a, b = shingle_sets[first], shingle_sets[second]
+            jaccard = len(a & b) / len(a | b)
+            if jaccard >= threshold:
+                linked.update((first, second))
+                first_root, second_root = root(first), root(second)
+                if first_root != second_root:
+                    parent[second_root] = first_root
+                    similarity[first_root] = min(similarity.get(first_root, 1.0),
+                                                 similarity.pop(second_root, 1.0), jaccard)
+        
+        groups = {}
+        for key, members in by_content.items():
+            if signatures[key] is None:
+                continue  # notes without words are blank, not duplicates
+            if key in linked or len(members) > 1:
+                groups.setdefault(root(key), []).extend(note_id for note_id, _ in members)
+        return sorted(((similarity.get(group_root, 1.0), ids) for group_root, ids in groups.items()
+                       if len(ids) > 1), key=lambda group: (-group[0], -len(group[1])))
 
 class ModernNotepadApp:
-    def __init__(self):
+    SPELL_FILL_BLOCK_LINES = 200
+    SPELL_MAX_PENDING_JOBS = 4  # worker backlog before the fill task waits
+    STATS_PANEL_DELAY_MS = 500  # quiet time after the last edit before re-analysis
+    STATS_PANEL_STEP_BUDGET_MS = 4  # analysis time per scheduler step
+    TERM_SYNC_DELAY_MS = 2000
+    
+    def __init__(self, startup_report=False, exit_after_startup=False):
+        startup_profile.mark("module imports")
+        self.startup_report = startup_report
+        self.exit_after_startup = exit_after_startup
+        
         self.root = tk.Tk()
         self.root.title("Modern Notepad - Python Edition with Spell Check")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 800)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Data
         self.notes: List[Note] = []
@@ -381,9 +2475,22 @@ class ModernNotepadApp:
         self.data_dir.mkdir(exist_ok=True)
         self.settings = AppSettings()
         
-        # Spell checker
-        self.spell_checker = SpellChecker()
-        self.misspelled_words = {}  # Store positions of misspelled words
+        # Spell checker and plugins are built after the window is shown
+        self._dictionaries = None
+        self._language_detector = None
+        self._note_language = None  # (note id, language) resolved for the open note
+        self._spell_worker = None
+        self._plugin_manager = None
+        self._text_analyzer = None
+        self.corpus_analytics = CorpusAnalytics()
+        self.term_frequencies = TermFrequencyStore()
+        self.duplicate_finder = DuplicateFinder()
+        self.misspelled_words = MisspellingIndex()  # Positions of misspelled words, by line
+        self.spell_jobs = {}  # job id -> snapshot submitted to the spell check worker
+        self.spell_version = 0  # bumped on every edit, so results can be checked for staleness
+        self._spell_job_counter = 0
+        self.spell_dirty_ranges = []  # Inclusive (first, last) line ranges awaiting a check
+        self._spell_line_count = 1
         self.suggestions_window = None
         
         # Variables
@@ -395,9 +2502,21 @@ class ModernNotepadApp:
         
         self.current_theme = "light"
         self.is_focus_mode = False
-        self.auto_save_timer = None
-        self.backup_timer = None
-        self.spell_check_timer = None
+        
+        # Background work (auto-save, backups, spell check, status resets)
+        self.scheduler = TaskScheduler(self.root)
+        
+        # UI latency instrumentation
+        self.latency = LatencyMonitor()
+        self.latency.start_lag_probe(self.root)
+        self._keypress_started = None
+        
+        # Large document mode
+        self.large_document_mode = False
+        self.large_document_features_enabled = False
+        self.loading_document = False
+        self.page_index = 0
+        self._page_line_starts = None
         
         # Templates
         self.note_templates = {
@@ -491,27 +2610,103 @@ Brief description of the project.
 """
         }
         
+        startup_profile.mark("tk root and state")
+        
         # Setup UI
         self.setup_styles()
         self.setup_ui()
         self.setup_menus()
         self.setup_bindings()
+        startup_profile.mark("build ui")
         
         # Load data
         self.load_settings()
         self.load_data()
         self.update_notes_list()
         self.update_category_combo()
+        startup_profile.mark("load notes")
+        
+        # Configure spell check tags
+        self.setup_spell_check_tags()
+        
+        # Everything else waits until the window and note list are on screen
+        self.root.after_idle(self.finish_startup)
+    
+    def finish_startup(self):
+        """Second startup stage, run once the first frame has been drawn"""
+        startup_profile.mark("first frame")
         
         if self.notes:
             self.select_note(0)
+        startup_profile.mark("open first note")
         
         # Start auto-save and backup timers
         self.start_auto_save()
         self.start_backup_timer()
         
-        # Configure spell check tags
-        self.setup_spell_check_tags()
+        # Build the spell checker in the background before the first check needs it
+        self.scheduler.schedule('warm_up_spell_checker', lambda: self.spell_checker,
+                                priority=TaskScheduler.LOW)
+        self.schedule_term_frequency_sync(0)
+        
+        if self.startup_report:
+            print(startup_profile.report())
+        if self.exit_after_startup:
+            self.root.after(0, self.root.quit)
+    
+    @property
+    def dictionaries(self):
+        """Per-language spell checkers, each loaded the first time a note needs it"""
+        if self._dictionaries is None:
+            self._dictionaries = DictionaryManager(
+                self.settings.spell_dictionary_memory_mb,
+                on_load=lambda language, elapsed_ms: self.latency.record('spell_checker_init', elapsed_ms))
+        return self._dictionaries
+    
+    @property
+    def spell_checker(self):
+        """Spell checker for the open note's language, kept off the startup path"""
+        return self.dictionaries.get(self.current_spell_language())
+    
+    @property
+    def language_detector(self):
+        if self._language_detector is None:
+            self._language_detector = LanguageDetector()
+        return self._language_detector
+    
+    def current_spell_language(self):
+        """Language of the open note, resolved once each time a note is opened"""
+        if self.current_note_index is None:
+            return self.settings.spell_check_language
+        note = self.notes[self.current_note_index]
+        if self._note_language is None or self._note_language[0] != note.id:
+            detector = self.language_detector if self.settings.detect_note_language else None
+            language = note_language(note, self.categories, self.settings.spell_check_language, detector)
+            self._note_language = (note.id, language)
+        return self._note_language[1]
+    
+    @property
+    def spell_worker(self):
+        """Background thread that checks spelling, started on first use"""
+        if self._spell_worker is None:
+            self._spell_worker = SpellCheckWorker()
+        return self._spell_worker
+    
+    @property
+    def text_analyzer(self):
+        """Paragraph-caching text analyzer from enhanced_features, shared with plugins"""
+        if self._text_analyzer is None:
+            enhanced_features = lazy_import('enhanced_features')
+            self._text_analyzer = enhanced_features.AdvancedTextAnalyzer()
+        return self._text_analyzer
+    
+    @property
+    def plugin_manager(self):
+        """Plugin manager from enhanced_features, imported on first use"""
+        if self._plugin_manager is None:
+            enhanced_features = lazy_import('enhanced_features')
+            self._plugin_manager = enhanced_features.PluginManager(self)
+        return self._plugin_manager
     
     def setup_spell_check_tags(self):
         """Setup text tags for spell checking"""
@@ -529,78 +2724,14 @@ Brief description of the project.
     def setup_styles(self):
         """Configure modern styling"""
         self.style = ttk.Style()
+        self.theme_engine = ThemeEngine(self.root, self.style)
+        self.theme_engine.register(self.root, 'root')
         self.apply_theme()
     
     def apply_theme(self):
         """Apply the current theme"""
-        if self.current_theme == "dark":
-            self.style.theme_use('clam')
-            
-            # Dark theme colors
-            bg_color = "#2d3748"
-            fg_color = "#e2e8f0"
-            select_color = "#4a5568"
-            accent_color = "#3182ce"
-            
-            self.root.configure(bg=bg_color)
-            
-            self.style.configure('Title.TLabel', 
-                               font=('Arial', 18, 'bold'),
-                               background=bg_color,
-                               foreground=fg_color)
-            
-            self.style.configure('Sidebar.TFrame', background=bg_color)
-            self.style.configure('Main.TFrame', background=bg_color)
-            
-            # Configure text widgets
-            if hasattr(self, 'content_text'):
-                self.content_text.configure(
-                    bg=select_color,
-                    fg=fg_color,
-                    insertbackground=fg_color,
-                    selectbackground=accent_color
-                )
-            
-            if hasattr(self, 'notes_listbox'):
-                self.notes_listbox.configure(
-                    bg=select_color,
-                    fg=fg_color,
-                    selectbackground=accent_color
-                )
-        else:
-            self.style.theme_use('clam')
-            
-            # Light theme colors
-            bg_color = "#f8fafc"
-            fg_color = "#1a202c"
-            select_color = "#ffffff"
-            accent_color = "#3182ce"
-            
-            self.root.configure(bg=bg_color)
-            
-            self.style.configure('Title.TLabel', 
-                               font=('Arial', 18, 'bold'),
-                               background=bg_color,
-                               foreground=fg_color)
-            
-            self.style.configure('Sidebar.TFrame', background=bg_color)
-            self.style.configure('Main.TFrame', background=select_color)
-            
-            # Configure text widgets
-            if hasattr(self, 'content_text'):
-                self.content_text.configure(
-                    bg=select_color,
-                    fg=fg_color,
-                    insertbackground=fg_color,
-                    selectbackground=accent_color
-                )
-            
-            if hasattr(self, 'notes_listbox'):
-                self.notes_listbox.configure(
-                    bg=select_color,
-                    fg=fg_color,
-                    selectbackground=accent_color
-                )
+        with self.latency.measure('apply_theme'):
+            self.theme_engine.apply(self.current_theme)
     
     def setup_ui(self):
         """Setup the main user interface"""
@@ -674,6 +2805,7 @@ Brief description of the project.
             activestyle='none'
         )
         self.notes_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.theme_engine.register(self.notes_listbox, 'listbox')
         list_scroll.config(command=self.notes_listbox.yview)
         
         self.notes_listbox.bind('<<ListboxSelect>>', self.on_note_selected)
@@ -773,10 +2905,19 @@ Brief description of the project.
             maxundo=50
         )
         self.content_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.theme_engine.register(self.content_text, 'text')
         text_scroll.config(command=self.content_text.yview)
         
+        # Live statistics panel, docked right of the editor
+        self.setup_statistics_panel(content_frame, text_scroll)
+        
         self.content_text.bind('<KeyRelease>', self.on_content_changed)
+        self.content_text.bind('<KeyPress>', self.on_content_keypress)
         self.content_text.bind('<Button-3>', self.show_editor_context_menu)
+        # Clipboard edits from menus or the mouse raise no KeyRelease; the class
+        # binding applies them after this one, hence after_idle
+        for sequence in ('<<Cut>>', '<<Paste>>', '<<PasteSelection>>'):
+            self.content_text.bind(sequence, lambda e: self.root.after_idle(self.on_content_changed, None))
         self.content_text.insert('1.0', "Start writing your note...")
         self.content_text.bind('<FocusIn>', self.on_content_focus_in)
         
@@ -792,6 +2933,30 @@ Brief description of the project.
         
         parent.add(editor_frame, weight=3)
     
+    def setup_statistics_panel(self, parent, text_scroll):
+        """Docked panel with live writing statistics for the open note"""
+        self.stats_panel_var = tk.BooleanVar(value=self.settings.show_statistics_panel)
+        self.stats_panel = ttk.LabelFrame(parent, text="Statistics")
+        self._stats_panel_anchor = text_scroll
+        
+        self.stats_panel_labels = {}
+        rows = [
+            ('reading_level', "Reading level"),
+            ('reading_time', "Reading time"),
+            ('sentence_length', "Avg. sentence"),
+            ('grammar_issues', "Grammar issues"),
+            ('top_words', "Top words")
+        ]
+        for key, caption in rows:
+            ttk.Label(self.stats_panel, text=caption, font=(self.settings.font_family, 9, 'bold')).pack(
+                anchor=tk.W, padx=10, pady=(8, 0))
+            label = ttk.Label(self.stats_panel, text="-", width=24, wraplength=180, justify=tk.LEFT)
+            label.pack(anchor=tk.W, padx=10)
+            self.stats_panel_labels[key] = label
+        
+        if self.settings.show_statistics_panel:
+            self.stats_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0), before=text_scroll)
+    
     def setup_status_bar(self):
         """Setup status bar"""
         status_frame = ttk.Frame(self.root)
@@ -805,6 +2970,9 @@ Brief description of the project.
         )
         self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
+        # Progress indicator for chunked loading of large notes (packed on demand)
+        self.load_progress = ttk.Progressbar(status_frame, length=150, mode='determinate', maximum=100)
+        
         # Auto-save indicator
         self.auto_save_label = ttk.Label(status_frame, text="Auto-save: ON", relief=tk.SUNKEN)
         self.auto_save_label.pack(side=tk.RIGHT, padx=(5, 0))
@@ -853,28 +3021,72 @@ Brief description of the project.
         format_menu.add_command(label="Font...", command=self.choose_font)
         
         # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
+        self.add_lazy_menu(menubar, "Tools", self.build_tools_menu)
+        
+        # View menu
+        self.paged_view_var = tk.BooleanVar(value=self.settings.large_document_paged_view)
+        self.spell_language_var = tk.StringVar(value='auto')
+        self.add_lazy_menu(menubar, "View", self.build_view_menu)
+        
+        # Plugins menu (imports enhanced_features the first time it opens)
+        self.add_lazy_menu(menubar, "Plugins", self.build_plugins_menu)
+        
+        # Help menu
+        self.add_lazy_menu(menubar, "Help", self.build_help_menu)
+    
+    def add_lazy_menu(self, menubar, label, builder):
+        """Add a cascade whose items are only created when it is first opened"""
+        menu = tk.Menu(menubar, tearoff=0)
+        
+        def populate():
+            if menu.index(tk.END) is None:
+                builder(menu)
+        
+        menu.configure(postcommand=populate)
+        menubar.add_cascade(label=label, menu=menu)
+        return menu
+    
+    def build_tools_menu(self, tools_menu):
         tools_menu.add_command(label="Toggle Spell Check", command=self.toggle_spell_check, accelerator="Ctrl+Shift+S")
         tools_menu.add_command(label="Check Spelling Now", command=self.check_spelling_now, accelerator="F7")
+        tools_menu.add_command(label="Check Spelling in All Notes...", command=self.show_batch_spell_check)
+        tools_menu.add_command(label="Find Duplicate Notes...", command=self.show_duplicate_notes)
+        language_menu = tk.Menu(tools_menu, tearoff=0)
+        language_menu.add_radiobutton(label="Automatic", value='auto', variable=self.spell_language_var,
+                                      command=self.set_note_language)
+        for code, name in SpellChecker.LANGUAGES.items():
+            language_menu.add_radiobutton(label=name, value=code, variable=self.spell_language_var,
+                                          command=self.set_note_language)
+        tools_menu.add_cascade(label="Spell Check Language", menu=language_menu)
+        tools_menu.add_command(label="Enable Spell Check and Stats for Large Note",
+                               command=self.enable_large_document_features)
         tools_menu.add_separator()
         tools_menu.add_command(label="Backup Notes", command=self.manual_backup)
         tools_menu.add_command(label="Restore from Backup", command=self.restore_backup)
         tools_menu.add_separator()
         tools_menu.add_command(label="Settings", command=self.show_settings, accelerator="Ctrl+,")
-        
-        # View menu
-        view_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="View", menu=view_menu)
+    
+    def build_view_menu(self, view_menu):
         view_menu.add_command(label="Toggle Theme", command=self.toggle_theme, accelerator="Ctrl+T")
         view_menu.add_command(label="Focus Mode", command=self.toggle_focus_mode, accelerator="F11")
         view_menu.add_separator()
+        view_menu.add_checkbutton(label="Paged View for Large Notes", variable=self.paged_view_var,
+                                  command=self.toggle_paged_view)
+        view_menu.add_command(label="Previous Page", command=lambda: self.change_page(-1), accelerator="Alt+PgUp")
+        view_menu.add_command(label="Next Page", command=lambda: self.change_page(1), accelerator="Alt+PgDn")
+        view_menu.add_separator()
         view_menu.add_command(label="Statistics", command=self.show_statistics, accelerator="Ctrl+Shift+T")
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
+        view_menu.add_checkbutton(label="Statistics Panel", variable=self.stats_panel_var,
+                                  command=self.toggle_statistics_panel)
+        view_menu.add_command(label="Corpus Analytics...", command=self.show_corpus_analytics)
+    
+    def build_plugins_menu(self, plugins_menu):
+        for item in self.plugin_manager.get_plugin_menu_items():
+            plugins_menu.add_command(label=item['label'], command=item['command'])
+    
+    def build_help_menu(self, help_menu):
         help_menu.add_command(label="Keyboard Shortcuts", command=self.show_shortcuts, accelerator="F1")
+        help_menu.add_command(label="Performance Diagnostics", command=self.show_diagnostics)
         help_menu.add_command(label="About", command=self.show_about)
     
     def setup_bindings(self):
@@ -909,6 +3121,8 @@ Brief description of the project.
         self.root.bind('<Control-t>', lambda e: self.toggle_theme())
         self.root.bind('<F11>', lambda e: self.toggle_focus_mode())
         self.root.bind('<Control-Shift-T>', lambda e: self.show_statistics())
+        self.root.bind('<Alt-Prior>', lambda e: self.change_page(-1))
+        self.root.bind('<Alt-Next>', lambda e: self.change_page(1))
         
         # Navigation
         self.root.bind('<Control-f>', lambda e: self.search_entry.focus())
@@ -928,82 +3142,296 @@ Brief description of the project.
         """Toggle spell checking on/off"""
         self.settings.spell_check_enabled = self.spell_check_var.get()
         
+        self.update_spell_check_label()
         if self.settings.spell_check_enabled:
-            self.spell_check_label.config(text="Spell Check: ON")
             self.check_spelling_now()
             self.start_spell_check_timer()
         else:
-            self.spell_check_label.config(text="Spell Check: OFF")
             self.clear_spell_check_highlights()
             self.stop_spell_check_timer()
         
         self.save_settings()
     
+    def update_spell_check_label(self):
+        if self.settings.spell_check_enabled:
+            self.spell_check_label.config(text=f"Spell Check: ON ({self.current_spell_language().upper()})")
+        else:
+            self.spell_check_label.config(text="Spell Check: OFF")
+    
+    def set_note_language(self):
+        """Apply the Spell Check Language menu choice to the open note"""
+        if self.current_note_index is None:
+            return
+        language = self.spell_language_var.get()
+        self.notes[self.current_note_index].language = '' if language == 'auto' else language
+        self._note_language = None
+        self.update_spell_check_label()
+        
+        # Highlights from the old language are meaningless now
+        self.clear_spell_check_highlights()
+        self.reset_spell_tracking()
+        if self.settings.spell_check_enabled and self.heavy_features_active():
+            self.scheduler.schedule('spell_check', self.check_spelling_on_open)
+    
+    @instrumented('check_spelling_now')
     def check_spelling_now(self):
         """Check spelling of current content immediately"""
-        if not self.settings.spell_check_enabled:
+        if not self.settings.spell_check_enabled or not self.heavy_features_active():
+            return
+        
+        # Existing highlights stay until the worker's result replaces them
+        self.spell_jobs.clear()
+        self.spell_dirty_ranges = []
+        self.check_spelling_lines(1, self.line_count())
+    
+    def check_spelling_lines(self, first_line, last_line):
+        """Send the given (inclusive) line range to the spell check worker"""
+        range_start = f"{first_line}.0"
+        range_end = f"{last_line}.end"
+        
+        # Get the content of the range
+        content = self.content_text.get(range_start, range_end)
+        if not content or (first_line == 1 and content == "Start writing your note..."):
+            self.content_text.tag_remove("misspelled", range_start, range_end)
+            self.misspelled_words.clear_lines(first_line, last_line)
+            return
+        
+        self._spell_job_counter += 1
+        self.spell_jobs[self._spell_job_counter] = {
+            'first': first_line, 'last': last_line, 'snapshot_first': first_line,
+            'text': content, 'version': self.spell_version
+        }
+        self.spell_worker.submit(self._spell_job_counter, first_line, content, self.spell_checker)
+        if not self.scheduler.is_scheduled('spell_results'):
+            self.scheduler.schedule('spell_results', self.drain_spell_results)
+    
+    def drain_spell_results(self):
+        """Task applying worker results each frame until no check is outstanding"""
+        while self.spell_jobs:
+            while True:
+                try:
+                    job_id, misspellings = self.spell_worker.results.get_nowait()
+                except queue.Empty:
+                    break
+                self.apply_spell_results(job_id, misspellings)
+            yield
+    
+    def apply_spell_results(self, job_id, misspellings):
+        """Replace the highlights of a checked range, unless its text has changed"""
+        job = self.spell_jobs.pop(job_id, None)
+        if job is None:
+            return  # note switched or spell check reset since the snapshot
+        
+        first_line, last_line = job['first'], job['last']
+        range_start = f"{first_line}.0"
+        range_end = f"{last_line}.end"
+        if job['version'] != self.spell_version and self.content_text.get(range_start, range_end) != job['text']:
+            self.mark_spell_dirty(first_line, last_line)
+            self.schedule_spell_check(300)
             return
         
-        # Clear existing highlights
+        self.content_text.tag_remove("misspelled", range_start, range_end)
+        self.misspelled_words.clear_lines(first_line, last_line)
+        
+        # Lines may have moved since the snapshot was taken
+        line_delta = first_line - job['snapshot_first']
+        tag_indices = []
+        for line, start_col, end_col, word in misspellings:
+            line += line_delta
+            tag_indices.append(f"{line}.{start_col}")
+            tag_indices.append(f"{line}.{end_col}")
+            self.misspelled_words.add(line, start_col, end_col, word)
+        
+        # Highlight every misspelled word with a single Tcl call
+        if tag_indices:
+            self.content_text.tag_add("misspelled", *tag_indices)
+        
+        if not self.spell_jobs and not self.spell_dirty_ranges:
+            self.store_spell_cache()
+    
+    # Incremental spell checking
+    def line_count(self):
+        return int(self.content_text.index(tk.END + '-1c').split('.')[0])
+    
+    def visible_line_range(self):
+        """First and last editor lines currently on screen"""
+        first = int(self.content_text.index('@0,0').split('.')[0])
+        last = int(self.content_text.index(f'@0,{self.content_text.winfo_height()}').split('.')[0])
+        return first, last
+    
+    def reset_spell_tracking(self, mark_all_dirty=True):
+        """Forget per-line state, e.g. after the editor was reloaded"""
+        self.misspelled_words.clear()
+        self.spell_jobs.clear()
+        self.spell_version += 1
+        self._spell_line_count = self.line_count()
+        self.spell_dirty_ranges = [(1, self._spell_line_count)] if mark_all_dirty else []
+    
+    def mark_spell_dirty(self, first_line, last_line):
+        """Add an inclusive line range to the set of lines needing a re-check"""
+        ranges = sorted(self.spell_dirty_ranges + [(first_line, last_line)])
+        merged = []
+        for first, last in ranges:
+            if merged and first <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+            else:
+                merged.append((first, last))
+        self.spell_dirty_ranges = merged
+    
+    def take_spell_dirty(self, first_line, last_line):
+        """Remove the part of the dirty set inside a line range and return it"""
+        taken = []
+        remaining = []
+        for first, last in self.spell_dirty_ranges:
+            if last < first_line or first > last_line:
+                remaining.append((first, last))
+                continue
+            if first < first_line:
+                remaining.append((first, first_line - 1))
+            if last > last_line:
+                remaining.append((last_line + 1, last))
+            taken.append((max(first, first_line), min(last, last_line)))
+        self.spell_dirty_ranges = remaining
+        return taken
+    
+    def track_spell_edit(self):
+        """Turn the latest edit into a dirty line range
+        
+        The edit is located from the insert cursor and the change in line
+        count, so pasted or deleted blocks dirty exactly the affected lines.
+        """
+        cursor_line = int(self.content_text.index(tk.INSERT).split('.')[0])
+        line_count = self.line_count()
+        delta = line_count - self._spell_line_count
+        self._spell_line_count = line_count
+        self.spell_version += 1
+        
+        edit_line = max(1, cursor_line - max(delta, 0))
+        if delta:
+            self.shift_spell_state(edit_line, delta)
+        self.mark_spell_dirty(edit_line, cursor_line)
+    
+    def shift_spell_state(self, edit_line, delta):
+        """Move line-based state after lines were inserted or removed below edit_line"""
+        def shift(line):
+            return line if line <= edit_line else max(edit_line, line + delta)
+        
+        dirty = self.spell_dirty_ranges
+        self.spell_dirty_ranges = []
+        for first, last in dirty:
+            self.mark_spell_dirty(shift(first), shift(last))
+        
+        self.misspelled_words.shift(edit_line, delta)
+        for job in self.spell_jobs.values():
+            job['first'], job['last'] = shift(job['first']), shift(job['last'])
+    
+    def check_spelling_on_open(self):
+        """Paint the opened note's cached results, or check it from scratch"""
+        if not self.restore_spell_cache():
+            self.check_spelling_incremental()
+    
+    def restore_spell_cache(self):
+        """Highlight the open note from its spell cache if still valid"""
+        if self.current_note_index is None or not self.settings.spell_check_enabled:
+            return False
+        note = self.notes[self.current_note_index]
+        cache = note.spell_cache
+        if (not cache or cache.get('dictionary') != self.spell_checker.dictionary_signature or
+                cache.get('content_hash') != content_hash(note.content)):
+            return False
+        
         self.clear_spell_check_highlights()
+        self.spell_dirty_ranges = []
+        tag_indices = []
+        for line, start_col, end_col, word in cache.get('misspellings', []):
+            tag_indices.append(f"{line}.{start_col}")
+            tag_indices.append(f"{line}.{end_col}")
+            self.misspelled_words.add(line, start_col, end_col, word)
+        if tag_indices:
+            self.content_text.tag_add("misspelled", *tag_indices)
+        
+        # Words added to the custom dictionary since are the only ones that changed
+        self.revalidate_misspellings()
+        return True
+    
+    def revalidate_misspellings(self):
+        """Drop highlights of words the dictionary now accepts, then update the cache"""
+        is_word_correct = self.spell_checker.is_word_correct
+        accepted = {info['word'] for info in self.misspelled_words if is_word_correct(info['word'])}
+        for info in list(self.misspelled_words):
+            if info['word'] in accepted:
+                self.content_text.tag_remove("misspelled", info['start'], info['end'])
+                self.misspelled_words.remove(info)
+        self.store_spell_cache()
+    
+    def store_spell_cache(self):
+        """Save the open note's results once every line has been checked"""
+        if self.current_note_index is None or self.spell_dirty_ranges or self.spell_jobs:
+            return
+        if self.is_paged_view_active():
+            return
         
-        # Get current content
-        content = self.content_text.get('1.0', tk.END + '-1c')
-        if not content or content == "Start writing your note...":
+        note = self.notes[self.current_note_index]
+        note.spell_cache = {
+            'content_hash': content_hash(self.content_text.get('1.0', tk.END + '-1c')),
+            'dictionary': self.spell_checker.dictionary_signature,
+            'misspellings': [[line, start_col, end_col, word]
+                             for line, spans in sorted(self.misspelled_words.lines.items())
+                             for start_col, end_col, word in spans],
+        }
+    
+    @instrumented('spell_check_incremental')
+    def check_spelling_incremental(self):
+        """Re-check dirty lines on screen now and leave the rest to idle time"""
+        if not self.settings.spell_check_enabled or not self.heavy_features_active():
+            return
+        if not self.spell_dirty_ranges:
             return
         
-        # Find all words and their positions
-        words_with_positions = []
-        for match in re.finditer(r'\b[a-zA-Z]+\b', content):
-            word = match.group()
-            start_pos = match.start()
-            end_pos = match.end()
-            words_with_positions.append((word, start_pos, end_pos))
-        
-        # Check each word
-        for word, start_pos, end_pos in words_with_positions:
-            if not self.spell_checker.is_word_correct(word):
-                # Convert string positions to Tkinter text positions
-                start_line = content[:start_pos].count('\n') + 1
-                start_col = start_pos - content.rfind('\n', 0, start_pos) - 1
-                end_line = content[:end_pos].count('\n') + 1
-                end_col = end_pos - content.rfind('\n', 0, end_pos) - 1
-                
-                start_index = f"{start_line}.{start_col}"
-                end_index = f"{end_line}.{end_col}"
-                
-                # Highlight misspelled word
-                self.content_text.tag_add("misspelled", start_index, end_index)
-                
-                # Store word position for suggestions
-                self.misspelled_words[start_index] = {
-                    'word': word,
-                    'start': start_index,
-                    'end': end_index
-                }
+        for first, last in self.take_spell_dirty(*self.visible_line_range()):
+            self.check_spelling_lines(first, last)
+        
+        if self.spell_dirty_ranges:
+            self.scheduler.schedule('spell_fill', self.fill_spell_check, priority=TaskScheduler.LOW)
+    
+    def fill_spell_check(self):
+        """Background task checking the remaining dirty lines a block at a time"""
+        while self.spell_dirty_ranges:
+            if not self.settings.spell_check_enabled or not self.heavy_features_active():
+                return
+            
+            # Lines scrolled into view since the last step go first
+            taken = self.take_spell_dirty(*self.visible_line_range())
+            if not taken:
+                first, last = self.spell_dirty_ranges[0]
+                taken = self.take_spell_dirty(first, min(last, first + self.SPELL_FILL_BLOCK_LINES - 1))
+            
+            for first, last in taken:
+                self.check_spelling_lines(first, last)
+            yield
+            
+            # Let the worker catch up rather than queueing the whole note
+            while len(self.spell_jobs) >= self.SPELL_MAX_PENDING_JOBS:
+                yield
     
     def clear_spell_check_highlights(self):
         """Clear all spell check highlights"""
         self.content_text.tag_remove("misspelled", '1.0', tk.END)
         self.misspelled_words.clear()
+        self.spell_jobs.clear()
     
     def start_spell_check_timer(self):
         """Start timer for automatic spell checking"""
-        if self.spell_check_timer:
-            self.root.after_cancel(self.spell_check_timer)
-        
-        def delayed_spell_check():
-            if self.settings.spell_check_enabled:
-                self.check_spelling_now()
-            self.spell_check_timer = self.root.after(2000, delayed_spell_check)  # Check every 2 seconds
-        
-        self.spell_check_timer = self.root.after(2000, delayed_spell_check)
+        self.scheduler.schedule('spell_check_timer', self.check_spelling_incremental, delay_ms=2000,
+                                priority=TaskScheduler.LOW, interval_ms=2000)  # Check every 2 seconds
     
     def stop_spell_check_timer(self):
         """Stop automatic spell checking timer"""
-        if self.spell_check_timer:
-            self.root.after_cancel(self.spell_check_timer)
-            self.spell_check_timer = None
+        self.scheduler.cancel('spell_check_timer')
+    
+    def schedule_spell_check(self, delay_ms):
+        """Debounced incremental spell check; a newer request replaces a pending one"""
+        self.scheduler.schedule('spell_check', self.check_spelling_incremental, delay_ms=delay_ms)
     
     def on_misspelled_word_click(self, event):
         """Handle click on misspelled word"""
@@ -1011,11 +3439,10 @@ Brief description of the project.
         index = self.content_text.index(f"@{event.x},{event.y}")
         
         # Find the misspelled word at this position
-        for pos, word_info in self.misspelled_words.items():
-            if self.content_text.compare(index, ">=", word_info['start']) and \
-               self.content_text.compare(index, "<=", word_info['end']):
-                self.show_spelling_suggestions(word_info, event.x_root, event.y_root)
-                break
+        line, col = map(int, index.split('.'))
+        word_info = self.misspelled_words.find(line, col)
+        if word_info:
+            self.show_spelling_suggestions(word_info, event.x_root, event.y_root)
     
     def on_misspelled_word_right_click(self, event):
         """Handle right-click on misspelled word"""
@@ -1037,15 +3464,16 @@ Brief description of the project.
         self.suggestions_window.grab_set()
         self.suggestions_window.resizable(False, False)
         
-        # Configure window
-        self.suggestions_window.configure(bg='white', relief='solid', bd=1)
+        # Configure window (colors come from the theme's option database)
+        palette = self.theme_engine.palette()
+        self.suggestions_window.configure(relief='solid', bd=1)
         
         # Header
-        header_frame = tk.Frame(self.suggestions_window, bg='#f0f0f0')
+        header_frame = tk.Frame(self.suggestions_window, bg=palette['header'])
         header_frame.pack(fill=tk.X, padx=1, pady=1)
         
         tk.Label(header_frame, text=f"Suggestions for: '{word}'", 
-                font=('Arial', 10, 'bold'), bg='#f0f0f0').pack(pady=5)
+                font=('Arial', 10, 'bold'), bg=palette['header']).pack(pady=5)
         
         # Suggestions list
         if suggestions:
@@ -1054,7 +3482,6 @@ Brief description of the project.
                     self.suggestions_window,
                     text=suggestion,
                     font=('Arial', 10),
-                    bg='white',
                     relief='flat',
                     anchor='w',
                     padx=10,
@@ -1065,21 +3492,21 @@ Brief description of the project.
                 
                 # Hover effects
                 def on_enter(e, button=btn):
-                    button.configure(bg='#e6f3ff')
+                    button.configure(bg=palette['hover'])
                 def on_leave(e, button=btn):
-                    button.configure(bg='white')
+                    button.configure(bg=palette['surface'])
                 
                 btn.bind('<Enter>', on_enter)
                 btn.bind('<Leave>', on_leave)
         else:
             tk.Label(self.suggestions_window, text="No suggestions found", 
-                    font=('Arial', 10), fg='gray', bg='white').pack(pady=10)
+                    font=('Arial', 10), fg=palette['muted']).pack(pady=10)
         
         # Separator
-        tk.Frame(self.suggestions_window, height=1, bg='#d0d0d0').pack(fill=tk.X, pady=2)
+        tk.Frame(self.suggestions_window, height=1, bg=palette['border']).pack(fill=tk.X, pady=2)
         
         # Action buttons
-        action_frame = tk.Frame(self.suggestions_window, bg='white')
+        action_frame = tk.Frame(self.suggestions_window)
         action_frame.pack(fill=tk.X, padx=5, pady=5)
         
         # Add to dictionary button
@@ -1140,7 +3567,9 @@ Brief description of the project.
         self.close_suggestions()
         
         # Update spell checking
-        self.root.after(100, self.check_spelling_now)  # Delay to allow text update
+        line = int(self.content_text.index(word_info['start']).split('.')[0])
+        self.mark_spell_dirty(line, line)
+        self.schedule_spell_check(100)  # Delay to allow text update
         
         # Update note content
         self.on_content_changed(None)
@@ -1149,24 +3578,20 @@ Brief description of the project.
         """Add word to custom dictionary"""
         self.spell_checker.add_to_dictionary(word)
         
-        # Remove highlight for this word
-        self.content_text.tag_remove("misspelled", word_info['start'], word_info['end'])
-        if word_info['start'] in self.misspelled_words:
-            del self.misspelled_words[word_info['start']]
+        # Remove the highlight from every occurrence of the word
+        self.revalidate_misspellings()
         
         # Close suggestions window
         self.close_suggestions()
         
         # Show confirmation
-        self.status_bar.config(text=f"Added '{word}' to dictionary")
-        self.root.after(3000, lambda: self.status_bar.config(text="Ready"))
+        self.set_status(f"Added '{word}' to dictionary", reset_ms=3000)
     
     def ignore_word(self, word_info):
         """Ignore the misspelled word (remove highlight)"""
         # Remove highlight for this word
         self.content_text.tag_remove("misspelled", word_info['start'], word_info['end'])
-        if word_info['start'] in self.misspelled_words:
-            del self.misspelled_words[word_info['start']]
+        self.misspelled_words.remove(word_info)
         
         # Close suggestions window
         self.close_suggestions()
@@ -1222,6 +3647,7 @@ Brief description of the project.
         else:
             self.update_notes_list()
     
+    @instrumented('search')
     def filter_notes_by_search(self, search_term):
         """Filter notes by search term"""
         self.notes_listbox.delete(0, tk.END)
@@ -1323,18 +3749,31 @@ Brief description of the project.
     def select_note(self, index):
         """Select and display a note"""
         if 0 <= index < len(self.notes):
+            self.flush_large_document_sync()
             self.current_note_index = index
             note = self.notes[index]
             
             # Update UI
             self.title_var.set(note.title)
+            self.reset_large_document_state()
             self.content_text.delete('1.0', tk.END)
-            self.content_text.insert('1.0', note.content)
+            
+            self.large_document_mode = len(note.content) > self.settings.large_document_threshold
+            if not self.large_document_mode:
+                self.content_text.insert('1.0', note.content)
+            elif self.settings.large_document_paged_view:
+                self.show_page(0)
+            else:
+                self.load_large_document(note)
             
             # Update metadata
             created = datetime.fromisoformat(note.created_at).strftime("%Y-%m-%d %H:%M")
             updated = datetime.fromisoformat(note.updated_at).strftime("%Y-%m-%d %H:%M")
-            word_count = len(note.content.split())
+            if self.large_document_mode:
+                # Splitting a multi-megabyte note just for the label is too slow
+                word_count = note.word_count
+            else:
+                word_count = len(note.content.split())
             char_count = len(note.content)
             
             meta_text = f"Created: {created} | Updated: {updated} | Words: {word_count} | Characters: {char_count}"
@@ -1348,9 +3787,217 @@ Brief description of the project.
             self.notes_listbox.selection_set(index)
             self.notes_listbox.see(index)
             
-            # Check spelling if enabled
-            if self.settings.spell_check_enabled:
-                self.root.after(500, self.check_spelling_now)
+            # Check spelling if enabled: cached results for an unchanged note,
+            # otherwise visible lines first and the rest when idle
+            self._note_language = None
+            self.spell_language_var.set(note.language or 'auto')
+            self.update_spell_check_label()
+            if self._dictionaries is not None:
+                self._dictionaries.evict_idle()
+            self.reset_spell_tracking()
+            if self.settings.spell_check_enabled and self.heavy_features_active():
+                self.scheduler.schedule('spell_check', self.check_spelling_on_open)
+            self.clear_statistics_panel()
+            if self.heavy_features_active():
+                self.schedule_statistics_update(0)
+    
+    # Live statistics panel
+    def toggle_statistics_panel(self):
+        """Show or hide the docked statistics panel"""
+        self.settings.show_statistics_panel = self.stats_panel_var.get()
+        if self.settings.show_statistics_panel:
+            self.stats_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0), before=self._stats_panel_anchor)
+            self.schedule_statistics_update(0)
+        else:
+            self.stats_panel.pack_forget()
+            self.scheduler.cancel('statistics_panel')
+        self.save_settings()
+    
+    def schedule_statistics_update(self, delay_ms):
+        """Debounced re-analysis of the open note for the statistics panel"""
+        if self.settings.show_statistics_panel and self.current_note_index is not None:
+            # Replaces a pending or half-finished pass, so only the last edit is analyzed
+            self.scheduler.schedule('statistics_panel', self.update_statistics_panel,
+                                    delay_ms=delay_ms, priority=TaskScheduler.LOW)
+    
+    def update_statistics_panel(self):
+        """Generator task: analyze the open note a few paragraphs per step
+        
+        Unchanged paragraphs come from the analyzer's cache, so after an edit
+        only the touched paragraph is tokenized. Each step stops once it has
+        used STATS_PANEL_STEP_BUDGET_MS, and the scheduler holds LOW tasks
+        back while the user is typing.
+        """
+        if self.current_note_index is None:
+            return
+        note = self.notes[self.current_note_index]
+        analyzer = self.text_analyzer
+        stats = lazy_import('enhanced_features').TextStats()
+        grammar_issues = 0
+        budget = self.STATS_PANEL_STEP_BUDGET_MS / 1000
+        
+        step_start = time.perf_counter()
+        for paragraph in analyzer.split_paragraphs(note.content):
+            # Long paragraphs are analyzed a chunk per step
+            steps = analyzer.analyze_paragraph_steps(paragraph)
+            while True:
+                try:
+                    next(steps)
+                except StopIteration as done:
+                    paragraph_stats, issues = done.value
+                    break
+                self.latency.record('statistics_panel_step', (time.perf_counter() - step_start) * 1000)
+                yield
+                step_start = time.perf_counter()
+            stats.merge(paragraph_stats)
+            grammar_issues += len(issues)
+            if time.perf_counter() - step_start > budget:
+                self.latency.record('statistics_panel_step', (time.perf_counter() - step_start) * 1000)
+                yield
+                step_start = time.perf_counter()
+        
+        summary = analyzer.statistics_summary(stats)
+        labels = self.stats_panel_labels
+        labels['reading_level'].config(text=summary['reading_level'])
+        labels['reading_time'].config(text=f"{summary['reading_time']:.1f} min")
+        labels['sentence_length'].config(text=f"{summary['average_words_per_sentence']:.1f} words")
+        labels['grammar_issues'].config(text=str(grammar_issues))
+        labels['top_words'].config(text=", ".join(word for word, _ in summary['most_common_words'][:5]) or "-")
+        self.latency.record('statistics_panel_step', (time.perf_counter() - step_start) * 1000)
+    
+    def clear_statistics_panel(self):
+        for label in self.stats_panel_labels.values():
+            label.config(text="-")
+    
+    def schedule_term_frequency_sync(self, delay_ms):
+        """Fold note edits into the term frequency store in the background"""
+        self.scheduler.schedule('term_frequencies', lambda: self.term_frequencies.sync_steps(self.notes),
+                                delay_ms=delay_ms, priority=TaskScheduler.LOW)
+    
+    # Large document mode
+    def heavy_features_active(self):
+        """Whether per-keystroke features (spell check, stats) should run for the open note"""
+        return not self.large_document_mode or self.large_document_features_enabled
+    
+    def reset_large_document_state(self):
+        """Cancel any pending chunked load and leave large document mode"""
+        self.scheduler.cancel('document_load')
+        self.flush_large_document_sync()
+        self.large_document_mode = False
+        self.large_document_features_enabled = False
+        self.loading_document = False
+        self.page_index = 0
+        self._page_line_starts = None
+        self.load_progress.pack_forget()
+        self.content_text.configure(state='normal', undo=True)
+    
+    def load_large_document(self, note):
+        """Insert a large note in chunks across idle callbacks so the UI stays responsive"""
+        content = note.content
+        total = len(content)
+        chunk_size = max(1, self.settings.large_document_chunk_size)
+        
+        self.loading_document = True
+        # Chunked inserts would otherwise fill the undo stack with the load itself
+        self.content_text.configure(undo=False, state='disabled')
+        self.load_progress.configure(value=0)
+        self.load_progress.pack(side=tk.RIGHT, padx=(5, 0))
+        self.status_bar.config(text=f"Loading large note ({total:,} characters)...")
+        
+        def load_chunks():
+            offset = 0
+            while offset < total:
+                end = min(offset + chunk_size, total)
+                # Prefer to break at a line boundary to keep each Tcl insert cheap
+                newline = content.rfind('\n', offset, end)
+                if end < total and newline > offset:
+                    end = newline + 1
+                
+                self.content_text.configure(state='normal')
+                self.content_text.insert(tk.END + '-1c', content[offset:end])
+                self.content_text.configure(state='disabled')
+                self.load_progress.configure(value=end * 100 / total)
+                offset = end
+                yield
+            
+            self.finish_large_document_load()
+        
+        self.scheduler.schedule('document_load', load_chunks, priority=TaskScheduler.HIGH)
+    
+    def finish_large_document_load(self):
+        """Re-enable editing once a chunked load has completed"""
+        self.loading_document = False
+        self.load_progress.pack_forget()
+        self.content_text.configure(state='normal', undo=True)
+        self.content_text.edit_reset()
+        self.content_text.mark_set(tk.INSERT, '1.0')
+        self.content_text.see('1.0')
+        self.set_status("Large note loaded - spell check and stats paused (Tools menu to enable)", reset_ms=5000)
+    
+    def enable_large_document_features(self):
+        """Opt in to spell check and live statistics for the open large note"""
+        if not self.large_document_mode or self.current_note_index is None:
+            return
+        
+        self.large_document_features_enabled = True
+        self.on_content_changed(None)
+        self.reset_spell_tracking()
+        if self.settings.spell_check_enabled:
+            self.check_spelling_incremental()
+    
+    def toggle_paged_view(self):
+        """Switch large notes between the paged read-mostly view and the full editor"""
+        self.settings.large_document_paged_view = self.paged_view_var.get()
+        self.save_settings()
+        
+        if self.large_document_mode and self.current_note_index is not None:
+            self.select_note(self.current_note_index)
+    
+    def is_paged_view_active(self):
+        return self.large_document_mode and self.settings.large_document_paged_view
+    
+    def show_page(self, page_index):
+        """Display one page of the current large note in a read-only editor"""
+        note = self.notes[self.current_note_index]
+        if self._page_line_starts is None:
+            self._page_line_starts = [0] + [m.end() for m in re.finditer('\n', note.content)]
+        
+        page_lines = max(1, self.settings.large_document_page_lines)
+        page_count = max(1, -(-len(self._page_line_starts) // page_lines))
+        self.page_index = max(0, min(page_index, page_count - 1))
+        
+        first_line = self.page_index * page_lines
+        start = self._page_line_starts[first_line]
+        last_line = first_line + page_lines
+        end = self._page_line_starts[last_line] if last_line < len(self._page_line_starts) else len(note.content)
+        
+        self.content_text.configure(state='normal', undo=False)
+        self.content_text.delete('1.0', tk.END)
+        self.content_text.insert('1.0', note.content[start:end])
+        self.content_text.configure(state='disabled')
+        self.status_bar.config(
+            text=f"Page {self.page_index + 1} of {page_count} (read-only - turn off View > Paged View to edit)")
+    
+    def change_page(self, direction):
+        """Move to the previous or next page in paged view"""
+        if self.is_paged_view_active():
+            self.show_page(self.page_index + direction)
+    
+    def flush_large_document_sync(self):
+        """Apply a pending deferred sync immediately"""
+        if self.scheduler.is_scheduled('large_document_sync'):
+            self.scheduler.cancel('large_document_sync')
+            self.sync_large_document()
+    
+    def sync_large_document(self):
+        """Copy the editor contents of a large note back into the note model"""
+        if self.current_note_index is None or not self.large_document_mode:
+            return
+        
+        note = self.notes[self.current_note_index]
+        note.content = self.content_text.get('1.0', tk.END + '-1c')
+        note.updated_at = datetime.now().isoformat()
+        note.char_count = len(note.content)
     
     def on_title_changed(self, *args):
         """Handle title changes"""
@@ -1361,9 +4008,33 @@ Brief description of the project.
                 self.notes[self.current_note_index].updated_at = datetime.now().isoformat()
                 self.update_notes_list()
     
+    def on_content_keypress(self, event):
+        """Start a keystroke-to-update measurement"""
+        # Results for snapshots taken before this key must be validated
+        self.spell_version += 1
+        if self._keypress_started is None:
+            self._keypress_started = time.perf_counter()
+            # The nested idle callback runs after Tk has redrawn the edit
+            self.root.after_idle(lambda: self.root.after_idle(self.finish_keypress_measurement))
+    
+    def finish_keypress_measurement(self):
+        if self._keypress_started is not None:
+            self.latency.record('keystroke_to_update', (time.perf_counter() - self._keypress_started) * 1000)
+            self._keypress_started = None
+    
+    @instrumented('on_content_changed')
     def on_content_changed(self, event):
         """Handle content changes"""
+        if event is not None:
+            self.scheduler.notify_input()
         if self.current_note_index is not None:
+            if self.loading_document or self.is_paged_view_active():
+                return
+            if not self.heavy_features_active():
+                # Copying a huge note out of the widget on every keystroke stalls typing
+                self.scheduler.schedule('large_document_sync', self.sync_large_document, delay_ms=750)
+                return
+            
             content = self.content_text.get('1.0', tk.END + '-1c')
             if content != "Start writing your note...":
                 self.notes[self.current_note_index].content = content
@@ -1387,12 +4058,14 @@ Brief description of the project.
                 self.meta_label.config(text=meta_text)
                 
                 # Trigger spell check if enabled
+                self.track_spell_edit()
                 if self.settings.spell_check_enabled:
-                    # Cancel previous timer and start new one
-                    if hasattr(self, '_spell_check_after_id'):
-                        self.root.after_cancel(self._spell_check_after_id)
-                    self._spell_check_after_id = self.root.after(1000, self.check_spelling_now)
+                    # Replaces any pending check, so only the last keystroke triggers it
+                    self.schedule_spell_check(300)
+                self.schedule_statistics_update(self.STATS_PANEL_DELAY_MS)
+                self.schedule_term_frequency_sync(self.TERM_SYNC_DELAY_MS)
     
+    @instrumented('update_notes_list')
     def update_notes_list(self):
         """Update the notes list display"""
         self.notes_listbox.delete(0, tk.END)
@@ -1432,16 +4105,35 @@ Brief description of the project.
         """Delete the current note"""
         if self.current_note_index is not None:
             if messagebox.askyesno("Delete Note", "Are you sure you want to delete this note?"):
-                del self.notes[self.current_note_index]
-                self.current_note_index = None
-                self.update_notes_list()
-                self.save_data()
-                
-                # Clear editor
-                self.title_var.set("Note title...")
-                self.content_text.delete('1.0', tk.END)
-                self.content_text.insert('1.0', "Start writing your note...")
-                self.meta_label.config(text="")
+                self.remove_notes({self.notes[self.current_note_index].id})
+    
+    def remove_notes(self, note_ids):
+        """Delete notes by id, clearing the editor if the open note is among them"""
+        current = self.notes[self.current_note_index] if self.current_note_index is not None else None
+        # A queued statistics pass would index the old note list
+        self.scheduler.cancel('statistics_panel')
+        self.notes = [note for note in self.notes if note.id not in note_ids]
+        for note_id in note_ids:
+            self.term_frequencies.remove(note_id)
+        
+        if current is not None and current.id not in note_ids:
+            self.current_note_index = self.notes.index(current)
+            self.update_notes_list()
+            self.notes_listbox.selection_set(self.current_note_index)
+            if self.heavy_features_active():
+                self.schedule_statistics_update(0)
+        else:
+            self.current_note_index = None
+            self.update_notes_list()
+            
+            # Clear editor
+            self.reset_large_document_state()
+            self.title_var.set("Note title...")
+            self.content_text.delete('1.0', tk.END)
+            self.content_text.insert('1.0', "Start writing your note...")
+            self.meta_label.config(text="")
+            self.clear_statistics_panel()
+        self.save_data()
     
     def toggle_focus_mode(self):
         """Toggle focus mode (hide sidebar)"""
@@ -1508,8 +4200,7 @@ Brief description of the project.
     # Simplified implementations for other methods
     def manual_save(self):
         self.save_data()
-        self.status_bar.config(text="Saved")
-        self.root.after(2000, lambda: self.status_bar.config(text="Ready"))
+        self.set_status("Saved", reset_ms=2000)
     
     def add_category(self):
         category = simpledialog.askstring("Add Category", "Enter category name:")
@@ -1531,6 +4222,7 @@ Brief description of the project.
             selected_text = self.content_text.get(sel_start, sel_end)
             self.content_text.delete(sel_start, sel_end)
             self.content_text.insert(sel_start, f"**{selected_text}**")
+            self.after_format_edit(sel_start, sel_end)
         except tk.TclError:
             pass
     
@@ -1541,6 +4233,7 @@ Brief description of the project.
             selected_text = self.content_text.get(sel_start, sel_end)
             self.content_text.delete(sel_start, sel_end)
             self.content_text.insert(sel_start, f"*{selected_text}*")
+            self.after_format_edit(sel_start, sel_end)
         except tk.TclError:
             pass
     
@@ -1551,21 +4244,36 @@ Brief description of the project.
             selected_text = self.content_text.get(sel_start, sel_end)
             self.content_text.delete(sel_start, sel_end)
             self.content_text.insert(sel_start, f"__{selected_text}__")
+            self.after_format_edit(sel_start, sel_end)
         except tk.TclError:
             pass
     
+    def after_format_edit(self, sel_start, sel_end):
+        """Record a menu formatting edit like a typed one and re-check its lines"""
+        self.on_content_changed(None)
+        self.mark_spell_dirty(int(sel_start.split('.')[0]), int(sel_end.split('.')[0]))
+    
     def undo(self):
         try:
             self.content_text.edit_undo()
+            self.recheck_after_bulk_edit()
         except tk.TclError:
             pass
     
     def redo(self):
         try:
             self.content_text.edit_redo()
+            self.recheck_after_bulk_edit()
         except tk.TclError:
             pass
     
+    def recheck_after_bulk_edit(self):
+        """Undo/redo can touch any line, so queue the whole note for re-checking"""
+        self._spell_line_count = self.line_count()
+        self.spell_version += 1
+        self.mark_spell_dirty(1, self._spell_line_count)
+        self.schedule_spell_check(300)
+    
     def cut_text(self):
         try:
             self.content_text.event_generate("<<Cut>>")
@@ -1619,6 +4327,9 @@ Brief description of the project.
         total_words = sum(note.word_count for note in self.notes)
         total_chars = sum(note.char_count for note in self.notes)
         favorites = sum(1 for note in self.notes if note.is_favorite)
+        self.flush_large_document_sync()
+        self.term_frequencies.sync(self.notes)
+        top_words = ", ".join(term for term, _ in self.term_frequencies.top_terms(10, min_length=4))
         
         stats_text = f"""Statistics:
         
@@ -1627,9 +4338,228 @@ Favorite Notes: {favorites}
 Total Words: {total_words:,}
 Total Characters: {total_chars:,}
 Average Words per Note: {total_words // max(total_notes, 1):,}
+Distinct Words: {len(self.term_frequencies.terms):,}
+Most Used Words: {top_words or '-'}
 """
         messagebox.showinfo("Statistics", stats_text)
     
+    def show_corpus_analytics(self):
+        """Dashboard of writing metrics across every note"""
+        self.flush_large_document_sync()
+        notes = [(note.content, note.created_at, list(note.categories)) for note in self.notes]
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Corpus Analytics")
+        dialog.geometry("760x560")
+        dialog.transient(self.root)
+        
+        ttk.Label(dialog, text="Corpus Analytics", font=('Arial', 14, 'bold')).pack(pady=10)
+        summary_label = ttk.Label(dialog, text="")
+        summary_label.pack(anchor=tk.W, padx=20)
+        
+        report_text = tk.Text(dialog, font=('Courier New', 9), wrap=tk.NONE)
+        report_text.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        progress = ttk.Progressbar(dialog, maximum=max(len(notes), 1))
+        progress.pack(fill=tk.X, padx=20)
+        
+        # Uncached notes are analyzed on a thread (and a process pool for big
+        # backlogs); progress and the result reach Tk through a queue
+        results = queue.Queue()
+        
+        def analyze():
+            try:
+                analyzed, data = self.corpus_analytics.analyze(notes, progress=lambda done: results.put(done))
+                results.put(('done', analyzed, data))
+            except Exception as e:
+                results.put(e)
+        
+        def chart(title, rows, unit=""):
+            report_text.insert(tk.END, f"{title}\n")
+            peak = max((value for _, value in rows), default=0) or 1
+            for label, value in rows:
+                bar = '#' * max(1 if value else 0, value * 40 // peak)
+                report_text.insert(tk.END, f"  {label:>18} {value:>10,}{unit} {bar}\n")
+            report_text.insert(tk.END, "\n")
+        
+        def render(analyzed, data):
+            progress.pack_forget()
+            summary_label.config(text=(
+                f"{data['total_notes']:,} notes, {data['total_words']:,} words, "
+                f"{data['total_characters']:,} characters, vocabulary of {data['vocabulary_size']:,} words "
+                f"({analyzed:,} notes analyzed, the rest cached)"))
+            report_text.delete('1.0', tk.END)
+            chart("Words written per month", data['words_by_month'])
+            chart("Words per category", data['words_by_category'])
+            chart("Vocabulary growth (distinct words)", data['vocabulary_growth'])
+            chart("Reading level", data['reading_levels'] + [("No sentences", data['unrated_notes'])], " notes")
+            report_text.configure(state='disabled')
+        
+        def drain():
+            while True:
+                if not dialog.winfo_exists():
+                    return
+                try:
+                    result = results.get_nowait()
+                except queue.Empty:
+                    yield
+                    continue
+                
+                if isinstance(result, Exception):
+                    messagebox.showerror("Analytics Error", f"Corpus analysis failed: {str(result)}", parent=dialog)
+                    return
+                if isinstance(result, tuple):
+                    render(result[1], result[2])
+                    return
+                progress['value'] = result
+                summary_label.config(text=f"Analyzing notes... {result:,} done")
+        
+        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(side=tk.RIGHT, padx=20, pady=10)
+        
+        threading.Thread(target=analyze, name="corpus-analytics", daemon=True).start()
+        self.scheduler.schedule('corpus_analytics', drain)
+    
+    def show_duplicate_notes(self):
+        """Find near-duplicate notes and offer to merge or delete them"""
+        self.flush_large_document_sync()
+        notes = [(note.id, note.content) for note in self.notes]
+        notes_by_id = {note.id: note for note in self.notes}
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Find Duplicate Notes")
+        dialog.geometry("760x480")
+        dialog.transient(self.root)
+        
+        ttk.Label(dialog, text="Near-Duplicate Notes", font=('Arial', 14, 'bold')).pack(pady=10)
+        
+        columns = ('updated', 'words')
+        tree = ttk.Treeview(dialog, columns=columns, height=14)
+        tree.heading('#0', text="Note")
+        tree.column('#0', width=400)
+        tree.heading('updated', text="Updated")
+        tree.column('updated', width=140)
+        tree.heading('words', text="Words")
+        tree.column('words', width=80, anchor=tk.E)
+        tree.pack(fill=tk.BOTH, expand=True, padx=20)
+        
+        status_label = ttk.Label(dialog, text=f"Comparing {len(notes):,} notes...")
+        status_label.pack(anchor=tk.W, padx=20, pady=(10, 0))
+        
+        results = queue.Queue()
+        
+        def find():
+            try:
+                results.put(self.duplicate_finder.find(notes))
+            except Exception as e:
+                results.put(e)
+        
+        def show(groups):
+            for number, (similarity, note_ids) in enumerate(groups, 1):
+                group = tree.insert('', tk.END, iid=f"group-{number}", open=True,
+                                    text=f"Group {number}: {len(note_ids)} notes, {similarity:.0%} similar")
+                for note_id in note_ids:
+                    note = notes_by_id.get(note_id)
+                    if note is not None:
+                        updated = datetime.fromisoformat(note.updated_at).strftime("%Y-%m-%d %H:%M")
+                        tree.insert(group, tk.END, iid=note_id, text=note.title,
+                                    values=(updated, len(note.content.split())))
+            status_label.config(text=f"{len(groups)} groups of similar notes" if groups else "No duplicates found")
+        
+        def drain():
+            while True:
+                if not dialog.winfo_exists():
+                    return
+                try:
+                    result = results.get_nowait()
+                except queue.Empty:
+                    yield
+                    continue
+                if isinstance(result, Exception):
+                    messagebox.showerror("Duplicate Search Error", f"Search failed: {str(result)}", parent=dialog)
+                else:
+                    show(result)
+                return
+        
+        def selected_group():
+            """Note ids of the group the selection belongs to"""
+            selection = tree.selection()
+            if not selection:
+                return None
+            group = selection[0] if not tree.parent(selection[0]) else tree.parent(selection[0])
+            return [note_id for note_id in tree.get_children(group) if note_id in notes_by_id]
+        
+        def open_note(event=None):
+            selection = tree.selection()
+            if selection and selection[0] in notes_by_id:
+                self.select_note(self.notes.index(notes_by_id[selection[0]]))
+        
+        def delete_selected():
+            note_ids = {item for item in tree.selection() if item in notes_by_id}
+            if not note_ids:
+                messagebox.showwarning("No Note", "Select the notes to delete.", parent=dialog)
+                return
+            if messagebox.askyesno("Delete Notes", f"Delete {len(note_ids)} note(s)?", parent=dialog):
+                self.remove_notes(note_ids)
+                for note_id in note_ids:
+                    del notes_by_id[note_id]
+                for note_id in note_ids:
+                    # Removing a group's second-to-last note also removes the group
+                    if not tree.exists(note_id):
+                        continue
+                    parent = tree.parent(note_id)
+                    tree.delete(note_id)
+                    if len(tree.get_children(parent)) < 2:
+                        tree.delete(parent)
+        
+        def merge_group():
+            note_ids = selected_group()
+            if not note_ids or len(note_ids) < 2:
+                messagebox.showwarning("No Group", "Select a group of notes to merge.", parent=dialog)
+                return
+            # Pending edits to an open large note must be in note.content first
+            self.flush_large_document_sync()
+            group = [notes_by_id[note_id] for note_id in note_ids]
+            keep = max(group, key=lambda note: note.updated_at)
+            if not messagebox.askyesno(
+                    "Merge Notes",
+                    f"Merge {len(group)} notes into \"{keep.title}\" (the most recently updated)?\n\n"
+                    "Paragraphs it lacks are appended and the other notes are deleted.", parent=dialog):
+                return
+            
+            paragraphs = keep.content.split('\n\n')
+            seen = set(paragraphs)
+            for note in group:
+                if note is keep:
+                    continue
+                for paragraph in note.content.split('\n\n'):
+                    if paragraph.strip() and paragraph not in seen:
+                        seen.add(paragraph)
+                        paragraphs.append(paragraph)
+                keep.categories.extend(category for category in note.categories if category not in keep.categories)
+                keep.is_favorite = keep.is_favorite or note.is_favorite
+            keep.content = '\n\n'.join(paragraphs)
+            keep.updated_at = datetime.now().isoformat()
+            keep.word_count = len(keep.content.split())
+            keep.char_count = len(keep.content)
+            
+            removed = {note.id for note in group if note is not keep}
+            self.remove_notes(removed)
+            self.select_note(self.notes.index(keep))
+            group_item = tree.parent(keep.id)
+            tree.delete(group_item)
+            for note_id in removed:
+                del notes_by_id[note_id]
+        
+        tree.bind('<Double-1>', open_note)
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill=tk.X, padx=20, pady=10)
+        ttk.Button(button_frame, text="Open", command=open_note).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Merge Group", command=merge_group).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Delete Selected", command=delete_selected).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT)
+        
+        threading.Thread(target=find, name="duplicate-finder", daemon=True).start()
+        self.scheduler.schedule('duplicate_finder', drain)
+    
     def show_shortcuts(self):
         shortcuts_text = """Keyboard Shortcuts:
 
@@ -1661,6 +4591,7 @@ View:
 Ctrl+T - Toggle Theme
 F11 - Focus Mode
 Ctrl+Shift+T - Statistics
+Alt+PgUp/PgDn - Previous/Next Page (large notes)
 
 Navigation:
 Ctrl+Up/Down - Navigate Notes
@@ -1669,6 +4600,194 @@ Ctrl+F - Focus Search
 """
         messagebox.showinfo("Keyboard Shortcuts", shortcuts_text)
     
+    def show_diagnostics(self):
+        """Show latency histograms and scheduler health"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Performance Diagnostics")
+        dialog.geometry("760x480")
+        dialog.transient(self.root)
+        
+        ttk.Label(dialog, text="UI Latency", font=('Arial', 14, 'bold')).pack(pady=10)
+        
+        columns = ('count', 'mean', 'p50', 'p95', 'p99', 'max')
+        tree = ttk.Treeview(dialog, columns=columns, height=8)
+        tree.heading('#0', text="Operation")
+        tree.column('#0', width=180)
+        for column in columns:
+            tree.heading(column, text=column if column == 'count' else f"{column} (ms)")
+            tree.column(column, width=80, anchor=tk.E)
+        tree.pack(fill=tk.X, padx=20)
+        
+        histogram_text = tk.Text(dialog, height=10, font=('Courier New', 9), wrap=tk.NONE)
+        histogram_text.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        
+        scheduler_label = ttk.Label(dialog, text="")
+        scheduler_label.pack(anchor=tk.W, padx=20)
+        cache_label = ttk.Label(dialog, text="")
+        cache_label.pack(anchor=tk.W, padx=20)
+        
+        def refresh():
+            tree.delete(*tree.get_children())
+            histogram_text.configure(state='normal')
+            histogram_text.delete('1.0', tk.END)
+            
+            for name, summary in self.latency.snapshot().items():
+                tree.insert('', tk.END, text=name, values=(
+                    summary['count'], summary['mean_ms'], summary['p50_ms'],
+                    summary['p95_ms'], summary['p99_ms'], summary['max_ms']))
+                
+                histogram_text.insert(tk.END, f"{name}\n")
+                peak = max(summary['histogram'].values()) or 1
+                for label, count in summary['histogram'].items():
+                    if count:
+                        bar = '#' * max(1, count * 40 // peak)
+                        histogram_text.insert(tk.END, f"  {label:>9} {count:>6} {bar}\n")
+            
+            histogram_text.configure(state='disabled')
+            stats = self.scheduler.get_stats()
+            scheduler_label.config(text=(
+                f"Scheduler: {stats['pending_tasks']} pending, queue depth {stats['queue_depth']}, "
+                f"lag {stats['lag_ms']} ms (max {stats['max_lag_ms']} ms), "
+                f"deferred {stats['deferred_count']} frames"))
+            if self._dictionaries is not None:
+                dictionaries = self._dictionaries
+                text = (f"Dictionaries: {', '.join(dictionaries.checkers) or 'none'} loaded, "
+                        f"~{dictionaries.memory_estimate() / (1024 * 1024):.1f} MB, "
+                        f"{dictionaries.evictions} evicted")
+                checker = dictionaries.peek(self.current_spell_language())
+                if checker is not None:
+                    cache = checker.suggestions_cache.stats()
+                    text += (f"\nSuggestion cache: {cache['size']}/{cache['max_size']} entries, "
+                             f"{cache['hits']} hits, {cache['misses']} misses ({cache['hit_rate']:.0%} hit rate)")
+                cache_label.config(text=text)
+        
+        def dump():
+            filename = filedialog.asksaveasfilename(
+                parent=dialog,
+                defaultextension=".json",
+                initialfile=f"diagnostics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                filetypes=[("JSON files", "*.json")]
+            )
+            if filename:
+                try:
+                    extra = {'scheduler': self.scheduler.get_stats()}
+                    if self._dictionaries is not None:
+                        extra['suggestion_cache'] = {language: checker.suggestions_cache.stats()
+                                                     for language, checker in self._dictionaries.checkers.items()}
+                    self.latency.dump_json(filename, extra)
+                except Exception as e:
+                    messagebox.showerror("Export Error", f"Failed to save diagnostics: {str(e)}", parent=dialog)
+        
+        def reset():
+            self.latency.reset()
+            refresh()
+        
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill=tk.X, padx=20, pady=10)
+        ttk.Button(button_frame, text="Refresh", command=refresh).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Save as JSON...", command=dump).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Reset", command=reset).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(button_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT)
+        
+        refresh()
+    
+    def show_batch_spell_check(self):
+        """Spell check every note on a process pool, listing results as they arrive"""
+        self.flush_large_document_sync()
+        detector = self.language_detector if self.settings.detect_note_language else None
+        notes = [(note.id, note.title, note.content,
+                  note_language(note, self.categories, self.settings.spell_check_language, detector))
+                 for note in self.notes]
+        notes_by_id = {note.id: note for note in self.notes}
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Check Spelling in All Notes")
+        dialog.geometry("760x480")
+        dialog.transient(self.root)
+        
+        ttk.Label(dialog, text="Misspellings by Note", font=('Arial', 14, 'bold')).pack(pady=10)
+        
+        columns = ('count', 'words')
+        tree = ttk.Treeview(dialog, columns=columns, height=14)
+        tree.heading('#0', text="Note")
+        tree.column('#0', width=200)
+        tree.heading('count', text="Misspellings")
+        tree.column('count', width=90, anchor=tk.E)
+        tree.heading('words', text="Words")
+        tree.column('words', width=400)
+        tree.pack(fill=tk.BOTH, expand=True, padx=20)
+        
+        progress = ttk.Progressbar(dialog, maximum=max(len(notes), 1))
+        progress.pack(fill=tk.X, padx=20, pady=(10, 0))
+        status_label = ttk.Label(dialog, text="Starting workers...")
+        status_label.pack(anchor=tk.W, padx=20)
+        
+        # The pool is driven from a thread; results reach Tk through a queue
+        results = queue.Queue()
+        cancelled = threading.Event()
+        
+        def run_pool():
+            try:
+                for result in batch_spell_check(notes, with_spell_cache=True):
+                    if cancelled.is_set():
+                        break
+                    results.put(result)
+            except Exception as e:
+                results.put(e)
+            results.put(None)
+        
+        def drain():
+            checked = 0
+            total = 0
+            while True:
+                if not dialog.winfo_exists():
+                    cancelled.set()
+                    return
+                try:
+                    result = results.get_nowait()
+                except queue.Empty:
+                    yield
+                    continue
+                
+                if result is None:
+                    status_label.config(text=f"Checked {checked} notes: {total} misspellings")
+                    return
+                if isinstance(result, Exception):
+                    messagebox.showerror("Spell Check Error", f"Batch spell check failed: {str(result)}",
+                                         parent=dialog)
+                    continue
+                
+                checked += 1
+                total += result['count']
+                note = notes_by_id.get(result['id'])
+                if note is not None:
+                    # Opening the note later paints these without a new check
+                    note.spell_cache = result['spell_cache']
+                if result['count']:
+                    words = ", ".join(f"{word} ({count})" for word, count in result['words'][:10])
+                    tree.insert('', tk.END, iid=result['id'], text=result['title'],
+                                values=(result['count'], words))
+                progress['value'] = checked
+                status_label.config(text=f"Checked {checked} of {len(notes)} notes...")
+                yield
+        
+        def open_note(event):
+            selection = tree.selection()
+            index = next((i for i, note in enumerate(self.notes) if selection and note.id == selection[0]), None)
+            if index is not None:
+                self.select_note(index)
+        
+        def close():
+            cancelled.set()
+            dialog.destroy()
+        
+        tree.bind('<Double-1>', open_note)
+        ttk.Button(dialog, text="Close", command=close).pack(side=tk.RIGHT, padx=20, pady=10)
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        
+        threading.Thread(target=run_pool, name="batch-spell-check", daemon=True).start()
+        self.scheduler.schedule('batch_spell_check', drain)
+    
     def show_about(self):
         about_text = """Modern Notepad - Python Edition
 Version 2.0 with Spell Check
@@ -1732,9 +4851,12 @@ Developed with ❤️ using Python"""
             print(f"Error loading data: {e}")
             self.notes = []
             self.categories = []
+        self.term_frequencies = TermFrequencyStore.load(self.data_dir / "term_frequencies.json")
     
+    @instrumented('save_data')
     def save_data(self):
         """Save notes to file"""
+        self.flush_large_document_sync()
         try:
             notes_file = self.data_dir / "notes.json"
             data = {
@@ -1746,6 +4868,7 @@ Developed with ❤️ using Python"""
                 json.dump(data, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Error saving data: {e}")
+        self.term_frequencies.save()
     
     def load_settings(self):
         """Load application settings"""
@@ -1771,20 +4894,25 @@ Developed with ❤️ using Python"""
     
     def start_auto_save(self):
         """Start auto-save timer"""
-        def auto_save():
-            self.save_data()
-            self.auto_save_timer = self.root.after(self.settings.auto_save_interval * 1000, auto_save)
-        
-        self.auto_save_timer = self.root.after(self.settings.auto_save_interval * 1000, auto_save)
+        interval_ms = self.settings.auto_save_interval * 1000
+        self.scheduler.schedule('auto_save', self.save_data, delay_ms=interval_ms,
+                                priority=TaskScheduler.LOW, interval_ms=interval_ms)
     
     def start_backup_timer(self):
         """Start backup timer"""
-        def create_backup_timer():
-            self.create_backup()
-            self.backup_timer = self.root.after(self.settings.backup_interval * 1000, create_backup_timer)
-        
         if self.settings.backup_enabled:
-            self.backup_timer = self.root.after(self.settings.backup_interval * 1000, create_backup_timer)
+            interval_ms = self.settings.backup_interval * 1000
+            self.scheduler.schedule('backup', self.create_backup, delay_ms=interval_ms,
+                                    priority=TaskScheduler.LOW, interval_ms=interval_ms)
+    
+    def set_status(self, text, reset_ms=None):
+        """Show a status message, optionally resetting to "Ready" afterwards"""
+        self.status_bar.config(text=text)
+        if reset_ms:
+            self.scheduler.schedule('status_reset', lambda: self.status_bar.config(text="Ready"),
+                                    delay_ms=reset_ms, priority=TaskScheduler.LOW)
+        else:
+            self.scheduler.cancel('status_reset')
     
     def create_backup(self):
         """Create a backup of notes"""
@@ -1814,6 +4942,13 @@ Developed with ❤️ using Python"""
         except Exception as e:
             print(f"Error creating backup: {e}")
     
+    def on_close(self):
+        """Window manager close: save while the editor still exists"""
+        # The Text widget is gone once the window is destroyed
+        self.flush_large_document_sync()
+        self.save_data()
+        self.root.destroy()
+    
     def run(self):
         """Start the application"""
         try:
@@ -1821,18 +4956,36 @@ Developed with ❤️ using Python"""
         except KeyboardInterrupt:
             pass
         finally:
-            # Cleanup
-            if self.auto_save_timer:
-                self.root.after_cancel(self.auto_save_timer)
-            if self.backup_timer:
-                self.root.after_cancel(self.backup_timer)
-            if self.spell_check_timer:
-                self.root.after_cancel(self.spell_check_timer)
+            # Cleanup; a deferred large-note sync must land before tasks are cancelled
+            try:
+                self.flush_large_document_sync()
+            except tk.TclError:
+                pass  # window already destroyed
+            self.scheduler.stop()
+            self.latency.stop_lag_probe(self.root)
+            if self._spell_worker is not None:
+                self._spell_worker.stop()
             
             # Final save
             self.save_data()
             self.save_settings()
 
 if __name__ == "__main__":
-    app = ModernNotepadApp()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Modern Notepad - Python Edition")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="print startup phase timings once the window is ready")
+    parser.add_argument('--exit-after-startup', action='store_true',
+                        help="quit as soon as startup completes (for benchmarking)")
+    parser.add_argument('--spell-check-all', action='store_true',
+                        help="spell check every saved note without opening a window, printing a report")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes for --spell-check-all (default: one per CPU)")
+    args = parser.parse_args()
+    
+    if args.spell_check_all:
+        sys.exit(print_batch_spell_check_report(Path.home() / ".notepad_app", max_workers=args.workers))
+    
+    app = ModernNotepadApp(startup_report=args.startup_report, exit_after_startup=args.exit_after_startup)
     app.run()